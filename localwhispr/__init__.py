@@ -51,4 +51,7 @@ def _preload_cuda_libs() -> None:
         os.environ["LD_LIBRARY_PATH"] = new_paths
 
 
-_preload_cuda_libs()
+# Set LOCALWHISPR_SKIP_CUDA_PRELOAD=1 for processes that never touch CUDA
+# (e.g. the overlay, or a CPU-only setup)
+if not os.environ.get("LOCALWHISPR_SKIP_CUDA_PRELOAD"):
+    _preload_cuda_libs()
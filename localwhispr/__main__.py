@@ -4,19 +4,51 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import logging
 import signal
 import sys
 
+# Named explicitly: under `python -m localwhispr` __name__ is plain "__main__",
+# which would fall outside the "localwhispr" logger _setup_logging configures
+log = logging.getLogger("localwhispr.__main__")
+
+# Modules cmd_serve needs; imported on a background thread at startup
+_SERVE_MODULES = ("recorder", "transcriber", "ai_cleanup", "screenshot", "typer", "server")
+
+
+class _LogFormatter(logging.Formatter):
+    """Prefix records with [localwhispr], spelling out the level for warnings and errors."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"[localwhispr] {record.levelname}: {message}"
+        return f"[localwhispr] {message}"
+
+
+def _setup_logging(debug: bool = False) -> None:
+    """Route the package's log records to stdout with the usual prefix."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_LogFormatter())
+    logger = logging.getLogger("localwhispr")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    logger.propagate = False  # keep third-party loggers (httpx...) out of it
+
 
 def cmd_serve(args: argparse.Namespace) -> None:
     """Start the LocalWhispr daemon."""
+    import importlib
+    import threading
+
+    # Load the component modules in the background while the config is read
+    preload = threading.Thread(
+        target=lambda: [importlib.import_module(f"localwhispr.{name}") for name in _SERVE_MODULES],
+        daemon=True,
+    )
+    preload.start()
+
     from localwhispr.config import load_config
-    from localwhispr.recorder import AudioRecorder
-    from localwhispr.transcriber import Transcriber
-    from localwhispr.ai_cleanup import AICleanup
-    from localwhispr.screenshot import ScreenshotCommand
-    from localwhispr.typer import Typer
-    from localwhispr.server import LocalWhisprApp, LocalWhisprDaemon
 
     print("=" * 60)
     print("  LocalWhispr v0.2.0")
@@ -25,9 +57,18 @@ def cmd_serve(args: argparse.Namespace) -> None:
 
     config = load_config(args.config)
 
+    preload.join()
+    from localwhispr.recorder import AudioRecorder
+    from localwhispr.transcriber import Transcriber
+    from localwhispr.ai_cleanup import AICleanup
+    from localwhispr.screenshot import ScreenshotCommand
+    from localwhispr.typer import Typer
+    from localwhispr.server import LocalWhisprApp, LocalWhisprDaemon
+
     # Initialize components
     recorder = AudioRecorder(config.audio)
-    transcriber = Transcriber(config.whisper)
+    # Dual capture transcribes the mic and headset tracks on two threads at once
+    transcriber = Transcriber(config.whisper, num_workers=2 if config.dictate.capture_monitor else 1)
     cleanup = AICleanup(config.ollama)
     screenshot_cmd = ScreenshotCommand(config.ollama)
     typer = Typer(config.typing)
@@ -52,7 +93,13 @@ def cmd_serve(args: argparse.Namespace) -> None:
     )
     daemon = LocalWhisprDaemon(app)
 
-    # Event loop
+    # Event loop (libuv-based unless the config asks for plain asyncio)
+    if config.daemon.event_loop == "uvloop":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            log.warning("uvloop not installed, using the default asyncio loop.")
     loop = asyncio.new_event_loop()
 
     def shutdown(sig: int, _: object) -> None:
@@ -105,6 +152,13 @@ def cmd_setup_shortcuts(args: argparse.Namespace) -> None:
 
 
 def main() -> None:
+    # Fast path for `ctl` (run on every keybinding press): skip building the
+    # full argparse tree; --help still goes through argparse below.
+    if len(sys.argv) >= 2 and sys.argv[1] == "ctl" and not {"-h", "--help"} & set(sys.argv[2:]):
+        from localwhispr.ctl import ctl_main
+        ctl_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         prog="localwhispr",
         description="LocalWhispr: Multimodal voice dictation with AI for Linux",
@@ -121,6 +175,10 @@ def main() -> None:
         "--preload-model", action="store_true",
         help="Pre-load Whisper model before accepting commands",
     )
+    p_serve.add_argument(
+        "--debug", action="store_true",
+        help="Verbose logging (audio file details, levels)",
+    )
     p_serve.set_defaults(func=cmd_serve)
 
     # --- ctl ---
@@ -176,6 +234,7 @@ def main() -> None:
         print("  3. Use Ctrl+Super+D to dictate, Ctrl+Shift+S for screenshot+AI, Ctrl+Super+M for meeting")
         sys.exit(0)
 
+    _setup_logging(getattr(args, "debug", False))
     args.func(args)
 
 
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import httpx
 
+from localwhispr.ollama import warmup
+
 if TYPE_CHECKING:
     from localwhispr.config import OllamaConfig
 
 
+log = logging.getLogger(__name__)
+
+
+# Polished results kept for repeated identical transcriptions ("ok", "yes"...)
+CACHE_SIZE = 256
+
+# Token budget for a cleanup, scaled with the input length
+MIN_PREDICT = 128
+MAX_PREDICT = 2048
+
+# Timed-out generations are retried with a shorter read timeout
+RETRY_ATTEMPTS = 3
+RETRY_READ_TIMEOUT_S = 8.0
+RETRY_BACKOFF_S = 0.5
+
+
 class AICleanup:
     """Uses Ollama to clean and polish transcribed text."""
 
@@ -20,42 +44,115 @@ class AICleanup:
         self._base_url = cfg.base_url.rstrip("/")
         self._model = cfg.cleanup_model
         self._prompt = cfg.cleanup_prompt
+        self._client = httpx.Client(
+            base_url=self._base_url,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=60),
+        )
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._keep_alive = cfg.keep_alive
+        self._bypass_max_chars = cfg.bypass_max_chars
+        self._bypass_punctuated_max_chars = cfg.bypass_punctuated_max_chars
+        self._hesitation_re = re.compile(cfg.bypass_hesitation_pattern, re.IGNORECASE)
+        if cfg.warmup:
+            warmup(self._client, self._model, self._keep_alive)
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection to Ollama."""
+        self._client.close()
 
     def cleanup(self, raw_text: str) -> str:
-        """Send raw text to Ollama and return polished text."""
+        """Send raw text to Ollama and return polished text.
+
+        Returns *raw_text* unchanged when Ollama is unreachable, fails mid-stream
+        or returns nothing, so a dropped connection never types a cut-off sentence.
+        """
         if not raw_text.strip():
             return ""
 
-        try:
-            response = httpx.post(
-                f"{self._base_url}/api/generate",
-                json={
-                    "model": self._model,
-                    "prompt": f"{self._prompt}\n\nTranscribed text:\n{raw_text}",
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,
-                        "num_predict": 2048,
-                    },
-                },
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            cleaned = data.get("response", "").strip()
+        # Short snippets without hesitations ("yes", "ok") are clean enough, and
+        # so are slightly longer ones Whisper already punctuated as a sentence
+        stripped = raw_text.strip()
+        if (
+            len(stripped) < self._bypass_max_chars
+            or (len(stripped) < self._bypass_punctuated_max_chars and stripped[-1] in ".!?")
+        ) and not self._hesitation_re.search(stripped):
+            log.info("AI cleanup skipped for short text: %s", stripped)
+            return stripped
+
+        key = self._cache_key(raw_text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            log.info("AI cleanup (cached): %s...", cached[:100])
+            return cached
+
+        for attempt in range(RETRY_ATTEMPTS):
+            # The first attempt gets the client's 30s; a retry expects a warm model
+            timeout = None if attempt == 0 else RETRY_READ_TIMEOUT_S
+            try:
+                cleaned = self._generate(raw_text, timeout).strip()
+                break
 
-            if cleaned:
-                print(f"[localwhispr] AI cleanup: {cleaned[:100]}...")
-                return cleaned
+            except httpx.TimeoutException as e:
+                if attempt == RETRY_ATTEMPTS - 1:
+                    log.error("AI cleanup failed: %s", e)
+                    return raw_text
+                log.info("AI cleanup timed out, retrying (%s/%s)...", attempt + 2, RETRY_ATTEMPTS)
+                time.sleep(RETRY_BACKOFF_S * 2**attempt)
+            except httpx.ConnectError:
+                log.error("Could not connect to Ollama. Is it running?")
+                log.info("URL: %s", self._base_url)
+                return raw_text
+            except Exception as e:
+                log.error("AI cleanup failed: %s", e)
+                return raw_text
 
+        if not cleaned:
             # Fallback: return original text if AI returns empty
             return raw_text
 
-        except httpx.ConnectError:
-            print("[localwhispr] ERROR: Could not connect to Ollama. Is it running?")
-            print(f"[localwhispr] URL: {self._base_url}")
-            return raw_text
-        except Exception as e:
-            print(f"[localwhispr] ERROR in AI cleanup: {e}")
-            return raw_text
+        log.info("AI cleanup: %s...", cleaned[:100])
+        self._cache[key] = cleaned
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return cleaned
+
+    def _generate(self, raw_text: str, timeout: float | None = None) -> str:
+        """Run one streamed /api/generate call and return the whole response.
+
+        *timeout* overrides the client's timeout when given. Raises if the
+        stream ends before Ollama reports ``done``.
+        """
+        parts: list[str] = []
+        with self._client.stream(
+            "POST",
+            "/api/generate",
+            json={
+                "model": self._model,
+                "prompt": f"{self._prompt}\n\nTranscribed text:\n{raw_text}",
+                "keep_alive": self._keep_alive,
+                "stream": True,
+                "options": {
+                    "temperature": 0.1,
+                    # Output is about as long as the input: don't reserve 2048 tokens for "ok"
+                    "num_predict": min(MAX_PREDICT, max(MIN_PREDICT, len(raw_text) // 2)),
+                },
+            },
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    return "".join(parts)
+        raise RuntimeError("Ollama stream ended before the response was complete")
 
+    def _cache_key(self, raw_text: str) -> str:
+        """Key a result by model, prompt and whitespace-normalized input text."""
+        normalized = " ".join(raw_text.split())
+        material = f"{self._model}|{self._prompt}|{normalized}".encode()
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
@@ -3,12 +3,34 @@
 from __future__ import annotations
 
 import math
-import struct
+import os
 import time
 from pathlib import Path
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # optional: the NumPy path below is used instead
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _sos_int16(buf: np.ndarray, n_channels: int) -> tuple[float, int]:
+        """Sum of squares of the channel-averaged frames, in a single pass."""
+        n_frames = buf.shape[0] // n_channels
+        sos = 0.0
+        for i in range(n_frames):
+            acc = 0.0
+            for c in range(n_channels):
+                acc += buf[i * n_channels + c]
+            acc /= n_channels
+            sos += acc * acc
+        return sos, n_frames
+else:
+    _sos_int16 = None
+
 
 class WavTailMonitor:
     """Reads the tail of a WAV file being written to compute RMS audio levels.
@@ -27,6 +49,8 @@ class WavTailMonitor:
 
     _DB_FLOOR = -45.0
     _DB_CEIL = -5.0
+    _DB_PER_NEPER = 20.0 / math.log(10.0)  # 20*log10(x) == _DB_PER_NEPER*ln(x)
+    _DB_INV_RANGE = 1.0 / (_DB_CEIL - _DB_FLOOR)
 
     def __init__(self, path: Path | str) -> None:
         self._path = Path(path)
@@ -35,6 +59,8 @@ class WavTailMonitor:
         self._sample_rate: int = 0
         self._data_offset: int = 0
         self._header_parsed = False
+        self._fd: int = -1
+        self._inode: int = 0
 
         self._last_file_size: int = 0
         self._level: float = 0.0
@@ -59,27 +85,34 @@ class WavTailMonitor:
         """True when the file grew since the previous update."""
         return self._growing
 
-    def _refresh(self) -> None:
-        """Re-read the file tail and recompute raw RMS."""
-        if not self._path.exists():
-            self._raw_rms = 0.0
-            self._level = 0.0
-            self._growing = False
-            return
+    def close(self) -> None:
+        """Close the file descriptor kept open between updates."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
 
+    def _refresh(self, buf: bytearray | None = None) -> None:
+        """Re-read the file tail and recompute raw RMS."""
         try:
-            file_size = self._path.stat().st_size
+            st = self._path.stat()
         except OSError:
             self._raw_rms = 0.0
             self._level = 0.0
             self._growing = False
             return
 
+        if self._header_parsed and st.st_ino != self._inode:
+            # File was replaced: start over with the new one
+            self.close()
+            self._header_parsed = False
+            self._last_file_size = 0
+
+        file_size = st.st_size
         self._growing = file_size > self._last_file_size
         self._last_file_size = file_size
 
         if not self._header_parsed:
-            if not self._parse_header():
+            if not self._open():
                 return
 
         if file_size <= self._data_offset:
@@ -87,7 +120,7 @@ class WavTailMonitor:
             self._level = 0.0
             return
 
-        self._raw_rms = self._compute_rms(file_size)
+        self._raw_rms = self._compute_rms(file_size, buf)
 
         if self._raw_rms > self.SILENCE_THRESHOLD:
             self._last_nonsilent = time.monotonic()
@@ -104,39 +137,65 @@ class WavTailMonitor:
         self._refresh()
         return self._raw_rms
 
+    def update_raw_into(self, buf: bytearray) -> float:
+        """Like :meth:`update_raw`, but read the tail into a caller-owned buffer.
+
+        *buf* must be at least ``CHUNK_BYTES`` long; it can be shared between
+        monitors that are updated one after the other.
+        """
+        self._refresh(buf)
+        return self._raw_rms
+
     def _to_perceptual(self, rms: float) -> float:
         """Map linear RMS to a 0–1 perceptual scale via dB."""
         if rms < 1e-7:
             return 0.0
-        db = 20.0 * math.log10(rms)
-        normalised = (db - self._DB_FLOOR) / (self._DB_CEIL - self._DB_FLOOR)
-        return max(0.0, min(1.0, normalised))
+        db = self._DB_PER_NEPER * math.log(rms)
+        normalised = (db - self._DB_FLOOR) * self._DB_INV_RANGE
+        return 0.0 if normalised < 0.0 else 1.0 if normalised > 1.0 else normalised
 
     # -- internals -----------------------------------------------------------
 
-    def _parse_header(self) -> bool:
-        """Parse the WAV/RIFF header to discover PCM layout and data offset."""
+    def _open(self) -> bool:
+        """Open the file and parse its header, keeping the fd for tail reads."""
+        try:
+            fd = os.open(self._path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            return False
+
         try:
-            with open(self._path, "rb") as f:
-                header = f.read(128)
+            header = os.pread(fd, 128, 0)
+            inode = os.fstat(fd).st_ino
         except OSError:
+            os.close(fd)
             return False
 
+        if not self._parse_header(header):
+            os.close(fd)
+            return False
+
+        self._fd = fd
+        self._inode = inode
+        return True
+
+    def _parse_header(self, header: bytes) -> bool:
+        """Parse the WAV/RIFF header to discover PCM layout and data offset."""
         if len(header) < 44 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
             return False
 
+        mv = memoryview(header)
         pos = 12
-        while pos + 8 <= len(header):
-            chunk_id = header[pos : pos + 4]
-            chunk_size = struct.unpack_from("<I", header, pos + 4)[0]
+        while pos + 8 <= len(mv):
+            chunk_id = mv[pos : pos + 4]
+            chunk_size = int.from_bytes(mv[pos + 4 : pos + 8], "little")
 
             if chunk_id == b"fmt ":
-                if pos + 8 + 16 > len(header):
+                if pos + 8 + 16 > len(mv):
                     return False
-                fmt = struct.unpack_from("<HHIIHH", header, pos + 8)
-                self._n_channels = fmt[1]
-                self._sample_rate = fmt[2]
-                self._sample_width = fmt[5] // 8
+                fmt = pos + 8  # audio_format, channels, rate, byte_rate, block_align, bits
+                self._n_channels = int.from_bytes(mv[fmt + 2 : fmt + 4], "little")
+                self._sample_rate = int.from_bytes(mv[fmt + 4 : fmt + 8], "little")
+                self._sample_width = int.from_bytes(mv[fmt + 14 : fmt + 16], "little") // 8
 
             elif chunk_id == b"data":
                 self._data_offset = pos + 8
@@ -151,7 +210,7 @@ class WavTailMonitor:
 
         return False
 
-    def _compute_rms(self, file_size: int) -> float:
+    def _compute_rms(self, file_size: int, buf: bytearray | None = None) -> float:
         """Read the last chunk of PCM data and return normalised RMS."""
         frame_size = self._n_channels * self._sample_width
         if frame_size == 0:
@@ -164,10 +223,13 @@ class WavTailMonitor:
 
         offset = max(self._data_offset, file_size - read_bytes)
 
+        # Positional reads: one syscall, no shared file offset to move
         try:
-            with open(self._path, "rb") as f:
-                f.seek(offset)
-                raw = f.read(read_bytes)
+            if buf is None:
+                raw = os.pread(self._fd, read_bytes, offset)
+            else:
+                view = memoryview(buf)[:read_bytes]
+                raw = view[: os.preadv(self._fd, [view], offset)]
         except OSError:
             return 0.0
 
@@ -183,8 +245,14 @@ class WavTailMonitor:
         else:
             return 0.0
 
+        if _sos_int16 is not None:
+            sos, n_frames = _sos_int16(samples, self._n_channels)
+            rms = math.sqrt(sos / n_frames) if n_frames else 0.0
+            return min(rms / max_val, 1.0)
+
         if self._n_channels > 1:
-            samples = samples.reshape(-1, self._n_channels).mean(axis=1).astype(np.int16)
+            # Downmix straight to float32 (no round-trip through int16)
+            samples = samples.reshape(-1, self._n_channels).mean(axis=1, dtype=np.float32)
 
-        rms = np.sqrt(np.mean(samples.astype(np.float64) ** 2))
+        rms = math.sqrt(float(np.mean(np.square(samples, dtype=np.float32))))
         return min(rms / max_val, 1.0)
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class ShortcutConfig:
@@ -24,6 +35,10 @@ class WhisperConfig:
     language: str = ""
     device: str = "cuda"
     compute_type: str = "float16"
+    beam_size: int = 5
+    vad_min_silence_ms: int = 500
+    vad_speech_pad_ms: int = 300
+    batch_size: int = 16  # meeting transcription batch (8 suits CPU int8; 0 = sequential chunks)
 
 
 @dataclass
@@ -31,6 +46,11 @@ class OllamaConfig:
     base_url: str = "http://localhost:11434"
     cleanup_model: str = "llama3.2"
     vision_model: str = "gemma3:12b"
+    keep_alive: str = "30m"  # how long Ollama keeps the models loaded after a request
+    warmup: bool = True  # load the models in the background when the daemon starts
+    bypass_max_chars: int = 20  # shorter snippets skip the LLM unless they hesitate (0 = off)
+    bypass_punctuated_max_chars: int = 0  # same, for snippets already ending in . ! or ? (0 = off)
+    bypass_hesitation_pattern: str = r"\b(uh|uhm|hmm|eh|tipo|né|então|assim)\b"
     cleanup_prompt: str = (
         "You are a voice transcription polishing assistant.\n"
         "Receive raw transcribed text and return ONLY the cleaned text:\n"
@@ -72,8 +92,11 @@ class MeetingConfig:
     mic_source: str = "auto"
     monitor_source: str = "auto"
     sample_rate: int = 16000
+    separate_tracks: bool = False  # transcribe mic/system separately instead of mixing
     overlay: bool = True
     summary_model: str = "llama3.2"
+    summary_parallel: int = 4  # block summaries requested at once (match OLLAMA_NUM_PARALLEL)
+    summary_mode: str = "parallel"  # long meetings: "parallel" blocks + meta-summary, or "rolling"
     summary_prompt: str = (
         "You are a meeting minutes assistant.\n"
         "Receive a meeting transcription and generate:\n"
@@ -86,6 +109,11 @@ class MeetingConfig:
     )
 
 
+@dataclass
+class DaemonConfig:
+    event_loop: str = "uvloop"  # "uvloop" or "asyncio"
+
+
 @dataclass
 class LocalWhisprConfig:
     shortcuts: ShortcutConfig = field(default_factory=ShortcutConfig)
@@ -96,15 +124,31 @@ class LocalWhisprConfig:
     dictate: DictateConfig = field(default_factory=DictateConfig)
     notifications: NotificationConfig = field(default_factory=NotificationConfig)
     meeting: MeetingConfig = field(default_factory=MeetingConfig)
+    daemon: DaemonConfig = field(default_factory=DaemonConfig)
 
 
 def _apply_dict(dc: Any, data: dict) -> None:
-    """Apply a dictionary onto an existing dataclass."""
+    """Apply a dictionary onto an existing dataclass (unknown keys are ignored)."""
+    known = dc.__dataclass_fields__
     for key, value in data.items():
-        if hasattr(dc, key):
+        if key in known:
             setattr(dc, key, value)
 
 
+@functools.lru_cache(maxsize=8)
+def _build_config_cached(path: str, mtime_ns: int) -> LocalWhisprConfig:
+    """Parse a YAML file into a config; cached per (resolved path, mtime) so
+    an edited file is re-read. Callers must deep-copy the result."""
+    with open(path) as f:
+        raw = yaml.load(f, Loader=_YamlLoader) or {}
+
+    config = LocalWhisprConfig()
+    for section in fields(config):
+        if section.name in raw:
+            _apply_dict(getattr(config, section.name), raw[section.name])
+    return config
+
+
 def load_config(path: str | Path | None = None) -> LocalWhisprConfig:
     """Load configuration from YAML. Searches in order:
     1. Explicit path
@@ -121,32 +165,14 @@ def load_config(path: str | Path | None = None) -> LocalWhisprConfig:
         Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "localwhispr" / "config.yaml",
     ])
 
-    config = LocalWhisprConfig()
-
     for p in search_paths:
         if p.is_file():
-            with open(p) as f:
-                raw = yaml.safe_load(f) or {}
-
-            if "shortcuts" in raw:
-                _apply_dict(config.shortcuts, raw["shortcuts"])
-            if "whisper" in raw:
-                _apply_dict(config.whisper, raw["whisper"])
-            if "ollama" in raw:
-                _apply_dict(config.ollama, raw["ollama"])
-            if "typing" in raw:
-                _apply_dict(config.typing, raw["typing"])
-            if "audio" in raw:
-                _apply_dict(config.audio, raw["audio"])
-            if "dictate" in raw:
-                _apply_dict(config.dictate, raw["dictate"])
-            if "notifications" in raw:
-                _apply_dict(config.notifications, raw["notifications"])
-            if "meeting" in raw:
-                _apply_dict(config.meeting, raw["meeting"])
-
-            print(f"[localwhispr] Config loaded from: {p}")
+            # Deep copy: the cached config must never be mutated by a caller
+            resolved = p.resolve()
+            config = copy.deepcopy(_build_config_cached(str(resolved), resolved.stat().st_mtime_ns))
+
+            log.info("Config loaded from: %s", p)
             return config
 
-    print("[localwhispr] No config.yaml found, using defaults.")
-    return config
+    log.info("No config.yaml found, using defaults.")
+    return LocalWhisprConfig()
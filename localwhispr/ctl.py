@@ -2,36 +2,43 @@
 
 from __future__ import annotations
 
-import asyncio
 import os
+import socket
 import sys
 from pathlib import Path
 
 SOCKET_PATH = Path(os.environ.get("XDG_RUNTIME_DIR", f"/run/user/{os.getuid()}")) / "localwhispr.sock"
 
 
-async def send_command(command: str) -> str:
-    """Send a command to the daemon and return the response."""
+def send_command(command: str) -> str:
+    """Send a command to the daemon and return the response.
+
+    A plain blocking socket: ctl runs once per keypress, and a single
+    connect/send/recv doesn't justify starting an asyncio event loop.
+    """
     if not SOCKET_PATH.exists():
         print("[localwhispr] Daemon is not running.")
         print("[localwhispr] Start with: localwhispr serve")
         sys.exit(1)
 
     try:
-        reader, writer = await asyncio.open_unix_connection(str(SOCKET_PATH))
-        writer.write(command.encode())
-        await writer.drain()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5.0)
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(f"{command}\n".encode())
+            sock.shutdown(socket.SHUT_WR)
 
-        response = await asyncio.wait_for(reader.read(4096), timeout=5.0)
-        writer.close()
-        await writer.wait_closed()
-        return response.decode().strip()
+            # The daemon closes the connection after its single reply
+            chunks = []
+            while chunk := sock.recv(4096):
+                chunks.append(chunk)
+        return b"".join(chunks).decode().strip()
 
     except ConnectionRefusedError:
         print("[localwhispr] Daemon is not responding.")
         print("[localwhispr] Restart with: localwhispr serve")
         sys.exit(1)
-    except asyncio.TimeoutError:
+    except TimeoutError:
         print("[localwhispr] Timeout waiting for daemon response.")
         sys.exit(1)
 
@@ -59,5 +66,5 @@ def ctl_main(args: list[str]) -> None:
         print(f"[localwhispr] Valid commands: {', '.join(sorted(valid_commands))}")
         sys.exit(1)
 
-    response = asyncio.run(send_command(command))
+    response = send_command(command)
     print(response)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import logging
+import math
+import shutil
 import signal
 import subprocess
 import time
@@ -17,13 +20,20 @@ if TYPE_CHECKING:
     from localwhispr.config import MeetingConfig
 
 
+log = logging.getLogger(__name__)
+
+
+# Frames per WAV read when downmixing a recording (1 s at 48 kHz)
+READ_CHUNK_FRAMES = 48000
+
+
 @dataclass
 class MeetingFiles:
     """Paths of files generated by a meeting recording."""
     output_dir: Path
     mic_wav: Path
     system_wav: Path
-    combined_wav: Path
+    combined_wav: Path | None  # None when the tracks are kept separate
     started_at: datetime
     duration_seconds: float
 
@@ -70,14 +80,14 @@ def detect_sources() -> dict[str, str]:
         sources["mic"] = usb_mics[0] if usb_mics else (mics[0] if mics else "")
 
         if monitors:
-            print(f"[localwhispr] Available monitors: {monitors}")
-            print(f"[localwhispr] Selected monitor: {sources['monitor']}")
+            log.info("Available monitors: %s", monitors)
+            log.info("Selected monitor: %s", sources['monitor'])
         if mics:
-            print(f"[localwhispr] Available mics: {mics}")
-            print(f"[localwhispr] Selected mic: {sources['mic']}")
+            log.info("Available mics: %s", mics)
+            log.info("Selected mic: %s", sources['mic'])
 
     except Exception as e:
-        print(f"[localwhispr] WARNING: failed to detect sources: {e}")
+        log.warning("Failed to detect sources: %s", e)
 
     return sources
 
@@ -93,6 +103,7 @@ class MeetingRecorder:
         self._sample_rate = cfg.sample_rate
         self._mic_source = cfg.mic_source
         self._monitor_source = cfg.monitor_source
+        self._separate_tracks = cfg.separate_tracks
 
         self._mic_proc: subprocess.Popen | None = None
         self._monitor_proc: subprocess.Popen | None = None
@@ -143,8 +154,8 @@ class MeetingRecorder:
                 "No monitor source detected. Configure 'monitor_source' in config.yaml"
             )
 
-        print(f"[localwhispr] Mic source:     {mic_src}")
-        print(f"[localwhispr] Monitor source: {monitor_src}")
+        log.info("Mic source:     %s", mic_src)
+        log.info("Monitor source: %s", monitor_src)
 
         # Create output directory
         self._started_at = datetime.now()
@@ -155,11 +166,18 @@ class MeetingRecorder:
         self._mic_path = self._output_dir / "mic.wav"
         self._monitor_path = self._output_dir / "system.wav"
 
-        # Start pw-record for mic (native sample rate, convert later)
+        # Record straight to mono s16 at the transcription rate: PipeWire's
+        # resampler does the conversion, so reading the WAVs back is a copy
+        rate = str(self._sample_rate)
+
+        # Start pw-record for mic
         self._mic_proc = subprocess.Popen(
             [
                 "pw-record",
                 "--target", mic_src,
+                "--rate", rate,
+                "--channels", "1",
+                "--format", "s16",
                 str(self._mic_path),
             ],
             stdin=subprocess.DEVNULL,
@@ -173,6 +191,9 @@ class MeetingRecorder:
                 "parecord",
                 "--device", monitor_src,
                 "--file-format=wav",
+                f"--rate={rate}",
+                "--channels=1",
+                "--format=s16le",
                 str(self._monitor_path),
             ],
             stdin=subprocess.DEVNULL,
@@ -181,7 +202,7 @@ class MeetingRecorder:
         )
 
         self._recording = True
-        print(f"[localwhispr] Recording meeting in: {self._output_dir}")
+        log.info("Recording meeting in: %s", self._output_dir)
         return self._output_dir
 
     def stop(self) -> MeetingFiles | None:
@@ -205,7 +226,7 @@ class MeetingRecorder:
                     except subprocess.TimeoutExpired:
                         proc.kill()
                 except Exception as e:
-                    print(f"[localwhispr] WARNING: error stopping {name}: {e}")
+                    log.warning("Error stopping %s: %s", name, e)
 
         self._mic_proc = None
         self._monitor_proc = None
@@ -216,16 +237,18 @@ class MeetingRecorder:
 
         for p in [self._mic_path, self._monitor_path]:
             if not p.exists():
-                print(f"[localwhispr] WARNING: file not found: {p}")
+                log.warning("File not found: %s", p)
             else:
                 size_kb = p.stat().st_size / 1024
-                print(f"[localwhispr] {p.name}: {size_kb:.1f} KB")
+                log.info("%s: %.1f KB", p.name, size_kb)
 
-        # Mix both channels
-        combined_path = self._output_dir / "combined.wav"
-        self._mix_audio(self._mic_path, self._monitor_path, combined_path)
+        # Mix both channels (unless each track is transcribed on its own)
+        combined_path: Path | None = None
+        if not self._separate_tracks:
+            combined_path = self._output_dir / "combined.wav"
+            self._mix_audio(self._mic_path, self._monitor_path, combined_path)
 
-        print(f"[localwhispr] Recording finished ({duration:.0f}s)")
+        log.info("Recording finished (%.0fs)", duration)
 
         return MeetingFiles(
             output_dir=self._output_dir,
@@ -238,12 +261,14 @@ class MeetingRecorder:
 
     def _mix_audio(self, mic_path: Path, monitor_path: Path, output_path: Path) -> None:
         """Combine mic + monitor into a single mono 16kHz WAV."""
+        if self._mix_with_ffmpeg(mic_path, monitor_path, output_path):
+            return
         try:
             mic_data = self._read_wav_as_mono_16k(mic_path)
             monitor_data = self._read_wav_as_mono_16k(monitor_path)
 
             if mic_data is None and monitor_data is None:
-                print("[localwhispr] WARNING: no audio to mix")
+                log.warning("No audio to mix")
                 return
 
             # If only one is available, use it
@@ -252,13 +277,18 @@ class MeetingRecorder:
             elif monitor_data is None:
                 combined = mic_data
             else:
-                # Equalize lengths (pad the shorter one with silence)
+                # Sum into one int32 buffer; the shorter track is implicitly
+                # padded with silence by the zeroed tail
                 max_len = max(len(mic_data), len(monitor_data))
-                mic_padded = np.pad(mic_data, (0, max_len - len(mic_data)))
-                mon_padded = np.pad(monitor_data, (0, max_len - len(monitor_data)))
+                acc = np.empty(max_len, dtype=np.int32)
+                acc[: len(mic_data)] = mic_data
+                acc[len(mic_data) :] = 0
+                acc[: len(monitor_data)] += monitor_data
 
-                # Mix: average of both channels (avoids clipping)
-                combined = ((mic_padded.astype(np.int32) + mon_padded.astype(np.int32)) // 2).astype(np.int16)
+                # Mix: full-level sum, saturated to the int16 range (halving
+                # would cost 6 dB of headroom on the usual single-speaker parts)
+                np.clip(acc, -32768, 32767, out=acc)
+                combined = acc.astype(np.int16)
 
             # Save combined WAV (mono, 16kHz, s16)
             with wave.open(str(output_path), "wb") as wf:
@@ -268,51 +298,102 @@ class MeetingRecorder:
                 wf.writeframes(combined.tobytes())
 
             size_kb = output_path.stat().st_size / 1024
-            print(f"[localwhispr] combined.wav: {size_kb:.1f} KB ({len(combined)/self._sample_rate:.0f}s)")
+            log.info("combined.wav: %.1f KB (%.0fs)", size_kb, len(combined)/self._sample_rate)
 
         except Exception as e:
-            print(f"[localwhispr] ERROR mixing audio: {e}")
+            log.error("Mixing audio failed: %s", e)
+
+    def _mix_with_ffmpeg(self, mic_path: Path, monitor_path: Path, output_path: Path) -> bool:
+        """Decode, resample and mix both tracks in one ffmpeg pass.
+
+        Returns False (so the NumPy path runs) when ffmpeg is missing, a track
+        is absent/empty, or ffmpeg fails.
+        """
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            return False
+        if not all(p.exists() and p.stat().st_size >= 100 for p in (mic_path, monitor_path)):
+            return False
+
+        cmd = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-i", str(mic_path), "-i", str(monitor_path),
+            # normalize=0: full-level sum, same as the NumPy mix
+            "-filter_complex", f"[0:a][1:a]amix=inputs=2:duration=longest:normalize=0,aresample={self._sample_rate}",
+            "-ac", "1", "-ar", str(self._sample_rate), "-c:a", "pcm_s16le",
+            str(output_path),
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            log.warning("ffmpeg mix failed (%s), falling back to NumPy", e)
+            return False
+        if result.returncode != 0:
+            log.warning("ffmpeg mix failed: %s", result.stderr.strip()[:200])
+            return False
+
+        size_kb = output_path.stat().st_size / 1024
+        log.info("combined.wav: %.1f KB (ffmpeg amix)", size_kb)
+        return True
+
+    @staticmethod
+    def _downmix(frames: np.ndarray) -> np.ndarray:
+        """(frames, channels) int16 -> mono, averaged in int32 (never float64)."""
+        n_channels = frames.shape[1]
+        if n_channels == 1:
+            return frames[:, 0]
+        if n_channels == 2:
+            return (frames[:, 0].astype(np.int32) + frames[:, 1]) >> 1
+        return frames.sum(axis=1, dtype=np.int32) // n_channels
+
+    def _read_wav_as_mono(self, path: Path) -> tuple[np.ndarray, int]:
+        """Decode a WAV to mono int16 at its native rate, READ_CHUNK_FRAMES at a time.
+
+        libsndfile handles any bit depth and does the conversion to s16 in C.
+        Each window is downmixed straight into one preallocated buffer, so the
+        interleaved multi-channel file is never resident.
+        """
+        import soundfile as sf
+
+        with sf.SoundFile(str(path)) as f:
+            n_frames = f.frames
+            log.debug("%s: %sch %sHz %s %s frames", path.name, f.channels, f.samplerate, f.subtype, n_frames)
+            data = np.empty(n_frames, dtype=np.int16)
+            written = 0
+            for block in f.blocks(READ_CHUNK_FRAMES, dtype="int16", always_2d=True):
+                mono = self._downmix(block)
+                data[written:written + len(mono)] = mono
+                written += len(mono)
+            return data[:written], f.samplerate
 
     def _read_wav_as_mono_16k(self, path: Path) -> np.ndarray | None:
         """Read WAV, convert to mono 16kHz int16."""
         if not path.exists() or path.stat().st_size < 100:
             return None
         try:
-            with wave.open(str(path), "rb") as wf:
-                n_channels = wf.getnchannels()
-                sample_rate = wf.getframerate()
-                sample_width = wf.getsampwidth()
-                n_frames = wf.getnframes()
-                raw = wf.readframes(n_frames)
-
-            print(f"[localwhispr] {path.name}: {n_channels}ch {sample_rate}Hz {sample_width*8}bit {n_frames} frames")
-
-            # Convert to int16 (if s32, reduce)
-            if sample_width == 4:
-                data = np.frombuffer(raw, dtype=np.int32)
-                data = (data >> 16).astype(np.int16)
-            elif sample_width == 2:
-                data = np.frombuffer(raw, dtype=np.int16)
-            else:
-                print(f"[localwhispr] WARNING: sample_width={sample_width} not supported")
-                return None
-
-            # Convert to mono (average channels)
-            if n_channels > 1:
-                data = data.reshape(-1, n_channels).mean(axis=1).astype(np.int16)
+            data, sample_rate = self._read_wav_as_mono(path)
 
-            # Resample to 16kHz if needed
+            # Resample to 16kHz if needed (polyphase FIR, anti-aliased)
             if sample_rate != self._sample_rate:
-                # Simple resampling via linear interpolation
-                duration = len(data) / sample_rate
-                target_len = int(duration * self._sample_rate)
-                indices = np.linspace(0, len(data) - 1, target_len)
-                data = np.interp(indices, np.arange(len(data)), data.astype(np.float64)).astype(np.int16)
-
-            rms = np.sqrt(np.mean(data.astype(np.float64)**2))
-            print(f"[localwhispr] {path.name} → mono 16kHz: {len(data)} samples, RMS={rms:.1f}")
+                from scipy.signal import resample_poly
+
+                g = math.gcd(sample_rate, self._sample_rate)
+                resampled = resample_poly(data.astype(np.float32), self._sample_rate // g, sample_rate // g)
+                # The filter can overshoot full scale slightly: clip before narrowing
+                data = np.clip(resampled, -32768, 32767).astype(np.int16)
+
+            # Diagnostic only: skip the extra full-array pass unless asked for
+            if log.isEnabledFor(logging.DEBUG):
+                # Exact integer sum of squares, widened one window at a time
+                # so no full-length float64/int64 copy is ever allocated
+                sum_sq = 0
+                for i in range(0, len(data), READ_CHUNK_FRAMES):
+                    block = data[i:i + READ_CHUNK_FRAMES].astype(np.int64)
+                    sum_sq += int(np.dot(block, block))
+                rms = math.sqrt(sum_sq / len(data)) if len(data) else 0.0
+                log.debug("%s → mono 16kHz: %s samples, RMS=%.1f", path.name, len(data), rms)
             return data
 
         except Exception as e:
-            print(f"[localwhispr] WARNING: error reading {path.name}: {e}")
+            log.warning("Error reading %s: %s", path.name, e)
             return None
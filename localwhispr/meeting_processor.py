@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import atexit
+import heapq
 import io
+import json
+import logging
+import threading
 import time
 import wave
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,14 +18,39 @@ import httpx
 import numpy as np
 
 if TYPE_CHECKING:
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
     from localwhispr.config import MeetingConfig, OllamaConfig, WhisperConfig
     from localwhispr.meeting import MeetingFiles
     from localwhispr.transcriber import Transcriber
 
+
+log = logging.getLogger(__name__)
+
+
 # Chunk size for transcription (5 minutes in samples at 16kHz)
 CHUNK_DURATION_S = 300  # 5 minutes
 # Word threshold for incremental summary
 SUMMARY_WORD_LIMIT = 3000
+# Chunks/tracks whose peak stays below this (about -50 dBFS) hold no speech
+SILENCE_PEAK = 100
+
+# Shared Ollama client: keep-alive connections reused across block summaries
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _ollama_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=httpx.Timeout(120.0, connect=10.0),
+                    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=30.0),
+                )
+                atexit.register(_client.close)
+    return _client
 
 
 def process_meeting(
@@ -35,13 +65,20 @@ def process_meeting(
     results: dict[str, Path] = {}
 
     # 1. Transcription
-    print("[localwhispr] Starting meeting transcription...")
+    log.info("Starting meeting transcription...")
     t0 = time.time()
-    transcription = transcribe_meeting(files.combined_wav, whisper_config, transcriber)
+    if files.combined_wav is not None:
+        transcription = transcribe_meeting(files.combined_wav, whisper_config, transcriber)
+    else:
+        # Tracks kept separate: transcribe each, interleave by timestamp,
+        # labelling each line with the side of the call it was heard on
+        transcription = transcribe_meeting_tracks(
+            [(files.mic_wav, "Me"), (files.system_wav, "Others")], whisper_config, transcriber,
+        )
     elapsed = time.time() - t0
 
     if not transcription:
-        print("[localwhispr] No audio transcribed from meeting.")
+        log.info("No audio transcribed from meeting.")
         return results
 
     # Save transcription
@@ -54,10 +91,10 @@ def process_meeting(
     )
     transcription_path.write_text(header + transcription, encoding="utf-8")
     results["transcription"] = transcription_path
-    print(f"[localwhispr] Transcription saved: {transcription_path}")
+    log.info("Transcription saved: %s", transcription_path)
 
     # 2. Meeting minutes / Summary with AI
-    print("[localwhispr] Generating meeting minutes with AI...")
+    log.info("Generating meeting minutes with AI...")
     summary = generate_summary(transcription, ollama_config, meeting_config)
 
     if summary:
@@ -69,9 +106,9 @@ def process_meeting(
         )
         summary_path.write_text(summary_header + summary, encoding="utf-8")
         results["summary"] = summary_path
-        print(f"[localwhispr] Minutes saved: {summary_path}")
+        log.info("Minutes saved: %s", summary_path)
     else:
-        print("[localwhispr] WARNING: could not generate meeting minutes.")
+        log.warning("Could not generate meeting minutes.")
 
     return results
 
@@ -82,79 +119,161 @@ def transcribe_meeting(
     transcriber: "Transcriber | None" = None,
 ) -> str:
     """Transcribe long audio in chunks with timestamps."""
-    if not wav_path.exists() or wav_path.stat().st_size < 1000:
-        return ""
+    return transcribe_meeting_tracks([(wav_path, "")], whisper_config, transcriber)
 
-    # Read the full audio
-    with wave.open(str(wav_path), "rb") as wf:
-        sample_rate = wf.getframerate()
-        n_frames = wf.getnframes()
-        raw_data = wf.readframes(n_frames)
 
-    audio = np.frombuffer(raw_data, dtype=np.int16)
-    total_duration = len(audio) / sample_rate
-    chunk_samples = CHUNK_DURATION_S * sample_rate
-
-    print(f"[localwhispr] Audio: {total_duration:.0f}s ({total_duration/60:.1f} min)")
+def transcribe_meeting_tracks(
+    wav_tracks: list[tuple[Path, str]],
+    whisper_config: "WhisperConfig",
+    transcriber: "Transcriber | None" = None,
+) -> str:
+    """Transcribe one or more (path, label) tracks of the same meeting and
+    interleave their segments by start time (used for separate mic/system
+    tracks). Non-empty labels prefix each line: "[00:12] Me: ..."."""
+    wav_tracks = [(p, label) for p, label in wav_tracks if p.exists() and p.stat().st_size >= 1000]
+    if not wav_tracks:
+        return ""
 
     # Reuse model already loaded by the daemon, or load a new one
     if transcriber:
         model = transcriber._ensure_model()
-        print("[localwhispr] Reusing Whisper model from daemon")
+        log.info("Reusing Whisper model from daemon")
     else:
         from faster_whisper import WhisperModel
-        print(f"[localwhispr] Loading Whisper '{whisper_config.model}'...")
+        log.info("Loading Whisper '%s'...", whisper_config.model)
         model = WhisperModel(
             whisper_config.model,
             device=whisper_config.device,
             compute_type=whisper_config.compute_type,
         )
 
+    from localwhispr.transcriber import transcribe_kwargs
+    kwargs = transcribe_kwargs(whisper_config)
+
+    if whisper_config.batch_size > 0:
+        # The batched pipeline VAD-splits the whole track and decodes the
+        # speech segments in batches: no outer 5-minute chunking needed
+        if transcriber:
+            batched = transcriber._ensure_batched()
+        else:
+            from faster_whisper import BatchedInferencePipeline
+            batched = BatchedInferencePipeline(model=model)
+        kwargs["batch_size"] = whisper_config.batch_size
+        tracks = [
+            [] if _track_is_silent(p) else _transcribe_track_batched(p, label, batched, kwargs)
+            for p, label in wav_tracks
+        ]
+    else:
+        tracks = [_transcribe_track(p, label, model, kwargs) for p, label in wav_tracks]
+    # Each track is already in start order: a linear merge interleaves them
+    merged = heapq.merge(*tracks, key=lambda seg: seg[0])
+    return "\n\n".join(
+        f"[{_format_duration(start)}] {label}: {text}" if label
+        else f"[{_format_duration(start)}] {text}"
+        for start, label, text in merged
+    )
+
+
+def _is_silent(pcm: np.ndarray) -> bool:
+    """True when no int16 sample reaches SILENCE_PEAK (max/min: no abs() temporary)."""
+    return not len(pcm) or (int(pcm.max()) < SILENCE_PEAK and int(pcm.min()) > -SILENCE_PEAK)
+
+
+def _track_is_silent(wav_path: Path) -> bool:
+    """Peak-scan a 16-bit WAV (memory-mapped, chunk by chunk) for any audible sample."""
+    from scipy.io import wavfile
+
+    try:
+        sample_rate, audio = wavfile.read(str(wav_path), mmap=True)
+    except Exception:
+        return False  # unreadable here: let Whisper try
+    if audio.dtype != np.int16:
+        return False
+    step = CHUNK_DURATION_S * sample_rate
+    if all(_is_silent(audio[i:i + step]) for i in range(0, len(audio), step)):
+        log.info("Skipping %s: silent for the whole meeting", wav_path.name)
+        return True
+    return False
+
+
+def _transcribe_track_batched(
+    wav_path: Path, label: str, batched: "BatchedInferencePipeline", kwargs: dict,
+) -> list[tuple[float, str, str]]:
+    """Transcribe one WAV in a single batched pass; returns (start, label, text) per segment."""
+    log.info("Transcribing %s (batch size %s)...", wav_path.name, kwargs['batch_size'])
+    segments, info = batched.transcribe(str(wav_path), **kwargs)
+    parts = [(segment.start, label, segment.text.strip()) for segment in segments]
+    log.info(
+        "Audio %s: %.0fs (%.1f min), %s segments",
+        wav_path.name,
+        info.duration,
+        info.duration/60,
+        len(parts),
+    )
+    return parts
+
+
+def _transcribe_track(
+    wav_path: Path, label: str, model: "WhisperModel", kwargs: dict,
+) -> list[tuple[float, str, str]]:
+    """Transcribe one WAV in chunks; returns (absolute start, label, text) per segment."""
+    from scipy.io import wavfile
+
+    from localwhispr.transcriber import WHISPER_SAMPLE_RATE
+
+    # Memory-map the samples: only the chunk being converted is ever paged in
+    sample_rate, audio = wavfile.read(str(wav_path), mmap=True)
+    if audio.dtype != np.int16:
+        log.warning("%s is %s, expected 16-bit PCM; skipped", wav_path.name, audio.dtype)
+        return []
+    total_duration = len(audio) / sample_rate
+    chunk_samples = CHUNK_DURATION_S * sample_rate
+
+    log.info("Audio %s: %.0fs (%.1f min)", wav_path.name, total_duration, total_duration/60)
+
     # Transcribe in chunks
-    parts: list[str] = []
+    parts: list[tuple[float, str, str]] = []
     n_chunks = max(1, int(np.ceil(len(audio) / chunk_samples)))
 
     for i in range(n_chunks):
         start_sample = i * chunk_samples
         end_sample = min((i + 1) * chunk_samples, len(audio))
         chunk = audio[start_sample:end_sample]
+        if chunk.ndim > 1:  # multi-channel: average in int32
+            chunk = (chunk.sum(axis=1, dtype=np.int32) // chunk.shape[1]).astype(np.int16)
 
         chunk_start_time = start_sample / sample_rate
         timestamp = _format_duration(chunk_start_time)
 
-        print(f"[localwhispr] Transcribing chunk {i+1}/{n_chunks} [{timestamp}]...")
-
-        # Convert chunk to in-memory WAV
-        wav_buf = io.BytesIO()
-        with wave.open(wav_buf, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(chunk.tobytes())
-        wav_buf.seek(0)
-
-        segments, _info = model.transcribe(
-            wav_buf,
-            language=whisper_config.language if whisper_config.language else None,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=500,
-                speech_pad_ms=300,
-            ),
-        )
+        if _is_silent(chunk):
+            # Breaks, waiting for people to join...: not worth a Whisper call
+            log.info("Skipping silent %s chunk %s/%s [%s]", wav_path.name, i+1, n_chunks, timestamp)
+            continue
+
+        log.info("Transcribing %s chunk %s/%s [%s]...", wav_path.name, i+1, n_chunks, timestamp)
+
+        if sample_rate == WHISPER_SAMPLE_RATE:
+            # Whisper's native rate: hand over float32 samples directly,
+            # converting one chunk at a time to keep peak memory bounded
+            # (one fused int16 -> scaled float32 pass, no intermediate)
+            chunk_input = np.multiply(chunk, np.float32(1.0 / 32768.0), dtype=np.float32)
+        else:
+            # Let faster-whisper decode and resample an in-memory WAV
+            chunk_input = io.BytesIO()
+            with wave.open(chunk_input, "wb") as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(sample_rate)
+                wf.writeframes(chunk)
+            chunk_input.seek(0)
+
+        segments, _info = model.transcribe(chunk_input, **kwargs)
 
-        chunk_text_parts: list[str] = []
         for segment in segments:
             # Absolute timestamp = chunk offset + segment timestamp
-            abs_start = chunk_start_time + segment.start
-            ts_str = _format_duration(abs_start)
-            chunk_text_parts.append(f"[{ts_str}] {segment.text.strip()}")
+            parts.append((chunk_start_time + segment.start, label, segment.text.strip()))
 
-        if chunk_text_parts:
-            parts.extend(chunk_text_parts)
-
-    return "\n\n".join(parts)
+    return parts
 
 
 def generate_summary(
@@ -164,76 +283,102 @@ def generate_summary(
 ) -> str:
     """Generate meeting minutes/summary via Ollama."""
     word_count = len(transcription.split())
-    print(f"[localwhispr] Transcription: {word_count} words")
+    log.info("Transcription: %s words", word_count)
 
     if word_count <= SUMMARY_WORD_LIMIT:
         # Fits in a single call
         return _ollama_summarize(transcription, ollama_config, meeting_config)
+    elif meeting_config.summary_mode == "rolling":
+        # One running summary, revised block by block
+        return _rolling_summary(transcription, ollama_config, meeting_config)
     else:
         # Incremental summary: split into blocks, summarize each, then meta-summary
         return _incremental_summary(transcription, ollama_config, meeting_config)
 
 
+def _ollama_generate(
+    prompt: str,
+    ollama_config: "OllamaConfig",
+    meeting_config: "MeetingConfig",
+) -> str:
+    """Run one generation with the summary model (raises on failure).
+
+    Streamed, so the client's read timeout bounds the gap between tokens
+    rather than the whole (possibly several-minute) generation.
+    """
+    base_url = ollama_config.base_url.rstrip("/")
+    parts: list[str] = []
+    with _ollama_client().stream(
+        "POST",
+        f"{base_url}/api/generate",
+        json={
+            "model": meeting_config.summary_model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": 0.3,
+                "num_predict": 4096,
+            },
+        },
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            parts.append(chunk.get("response", ""))
+            if chunk.get("done"):
+                break
+    return "".join(parts).strip()
+
+
 def _ollama_summarize(
     text: str,
     ollama_config: "OllamaConfig",
     meeting_config: "MeetingConfig",
 ) -> str:
     """Send text to Ollama for summary generation."""
-    base_url = ollama_config.base_url.rstrip("/")
-    model = meeting_config.summary_model
     prompt = meeting_config.summary_prompt
-
     try:
-        response = httpx.post(
-            f"{base_url}/api/generate",
-            json={
-                "model": model,
-                "prompt": f"{prompt}\n\nMeeting transcription:\n\n{text}",
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,
-                    "num_predict": 4096,
-                },
-            },
-            timeout=120.0,
+        return _ollama_generate(
+            f"{prompt}\n\nMeeting transcription:\n\n{text}", ollama_config, meeting_config,
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("response", "").strip()
-
     except httpx.ConnectError:
-        print("[localwhispr] ERROR: Could not connect to Ollama.")
+        log.error("Could not connect to Ollama.")
         return ""
     except Exception as e:
-        print(f"[localwhispr] ERROR generating meeting minutes: {e}")
+        log.error("Generating meeting minutes failed: %s", e)
         return ""
 
 
+def _split_blocks(transcription: str, block_size: int = 2500) -> list[str]:
+    """Split a transcription into blocks of ~block_size words."""
+    words = transcription.split()
+    return [" ".join(words[i:i + block_size]) for i in range(0, len(words), block_size)]
+
+
 def _incremental_summary(
     transcription: str,
     ollama_config: "OllamaConfig",
     meeting_config: "MeetingConfig",
 ) -> str:
     """Summarize long transcriptions in blocks and then create a meta-summary."""
-    # Split into ~2500 word blocks
-    words = transcription.split()
-    block_size = 2500
-    blocks: list[str] = []
+    blocks = _split_blocks(transcription)
+    log.info("Incremental summary: %s blocks", len(blocks))
 
-    for i in range(0, len(words), block_size):
-        block = " ".join(words[i:i + block_size])
-        blocks.append(block)
+    # Summarize the blocks concurrently: the requests are independent, and
+    # Ollama serves up to OLLAMA_NUM_PARALLEL of them at once
+    def summarize_block(idx: int) -> str:
+        log.info("Summarizing block %s/%s...", idx+1, len(blocks))
+        return _ollama_summarize(blocks[idx], ollama_config, meeting_config)
 
-    print(f"[localwhispr] Incremental summary: {len(blocks)} blocks")
+    workers = max(1, min(meeting_config.summary_parallel, len(blocks)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lw-summary") as pool:
+        summaries = list(pool.map(summarize_block, range(len(blocks))))
 
-    # Summarize each block
-    partial_summaries: list[str] = []
-    for idx, block in enumerate(blocks):
-        print(f"[localwhispr] Summarizing block {idx+1}/{len(blocks)}...")
-        summary = _ollama_summarize(block, ollama_config, meeting_config)
-        if summary:
-            partial_summaries.append(f"## Part {idx+1}\n\n{summary}")
+    partial_summaries = [
+        f"## Part {idx+1}\n\n{summary}" for idx, summary in enumerate(summaries) if summary
+    ]
 
     if not partial_summaries:
         return ""
@@ -244,7 +389,7 @@ def _incremental_summary(
 
     # Meta-summary: combine partial summaries
     combined = "\n\n---\n\n".join(partial_summaries)
-    print("[localwhispr] Generating meta-summary...")
+    log.info("Generating meta-summary...")
 
     meta_prompt = (
         "You received partial summaries of a long meeting. "
@@ -254,37 +399,61 @@ def _incremental_summary(
         "IMPORTANT: Respond in the SAME LANGUAGE as the transcription."
     )
 
-    base_url = ollama_config.base_url.rstrip("/")
     try:
-        response = httpx.post(
-            f"{base_url}/api/generate",
-            json={
-                "model": meeting_config.summary_model,
-                "prompt": f"{meta_prompt}\n\nPartial summaries:\n\n{combined}",
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,
-                    "num_predict": 4096,
-                },
-            },
-            timeout=120.0,
+        return _ollama_generate(
+            f"{meta_prompt}\n\nPartial summaries:\n\n{combined}", ollama_config, meeting_config,
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("response", "").strip()
     except Exception as e:
-        print(f"[localwhispr] ERROR in meta-summary: {e}")
+        log.error("Meta-summary failed: %s", e)
         # Return partial summaries as fallback
         return combined
 
 
+def _rolling_summary(
+    transcription: str,
+    ollama_config: "OllamaConfig",
+    meeting_config: "MeetingConfig",
+) -> str:
+    """Summarize long transcriptions by revising one running summary per block.
+
+    Each call sees the summary so far plus the next block, so later parts are
+    summarized with the earlier context and no meta-summary pass is needed.
+    Sequential by nature: slower wall-clock than the parallel mode.
+    """
+    blocks = _split_blocks(transcription)
+    log.info("Rolling summary: %s blocks", len(blocks))
+
+    rolling_prompt = (
+        "You are revising the minutes of a long meeting as its transcription "
+        "arrives in parts. Update the CURRENT MINUTES with the NEW PART and "
+        "output the complete revised minutes, which replace the current ones. "
+        "Keep everything still relevant from the current minutes."
+    )
+
+    memory = ""
+    for idx, block in enumerate(blocks):
+        log.info("Summarizing block %s/%s...", idx+1, len(blocks))
+        prompt = (
+            f"{meeting_config.summary_prompt}\n\n{rolling_prompt}\n\n"
+            f"CURRENT MINUTES:\n\n{memory or '(none yet)'}\n\n"
+            f"NEW PART ({idx+1}/{len(blocks)}):\n\n{block}"
+        )
+        try:
+            memory = _ollama_generate(prompt, ollama_config, meeting_config) or memory
+        except httpx.ConnectError:
+            log.error("Could not connect to Ollama.")
+            return memory
+        except Exception as e:
+            # Keep the minutes so far; the next block may still go through
+            log.error("Summarizing block %s failed: %s", idx+1, e)
+
+    return memory
+
+
 def _format_duration(seconds: float) -> str:
-    """Format seconds as HH:MM:SS."""
-    td = timedelta(seconds=int(seconds))
-    total_seconds = int(td.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-    if hours > 0:
+    """Format seconds as HH:MM:SS (MM:SS under an hour)."""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     return f"{minutes:02d}:{secs:02d}"
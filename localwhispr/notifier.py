@@ -2,16 +2,47 @@
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import subprocess
 import shutil
+import threading
 
 from localwhispr.config import NotificationConfig
 
+_canberra_lock = threading.Lock()
+_canberra: tuple[ctypes.CDLL, ctypes.c_void_p] | None = None
+_canberra_failed = False
+
 
 def _has_command(cmd: str) -> bool:
     return shutil.which(cmd) is not None
 
 
+def _canberra_context() -> tuple[ctypes.CDLL, ctypes.c_void_p] | None:
+    """Load libcanberra once and keep one context for the daemon's lifetime.
+
+    Playing through it is an in-process call (libcanberra plays
+    asynchronously on its own thread) instead of a fork+exec per sound.
+    """
+    global _canberra, _canberra_failed
+    if _canberra is None and not _canberra_failed:
+        with _canberra_lock:
+            if _canberra is None and not _canberra_failed:
+                try:
+                    lib = ctypes.CDLL(ctypes.util.find_library("canberra") or "libcanberra.so.0")
+                    ctx = ctypes.c_void_p()
+                    if lib.ca_context_create(ctypes.byref(ctx)) != 0:
+                        raise OSError("ca_context_create failed")
+                    lib.ca_context_change_props(
+                        ctx, b"application.name", b"LocalWhispr", ctypes.c_char_p(None)
+                    )
+                    _canberra = (lib, ctx)
+                except (OSError, AttributeError):
+                    _canberra_failed = True  # fall back to canberra-gtk-play
+    return _canberra
+
+
 def notify(title: str, body: str = "", config: NotificationConfig | None = None) -> None:
     """Send a notification via notify-send."""
     if config and not config.enabled:
@@ -36,10 +67,19 @@ def notify(title: str, body: str = "", config: NotificationConfig | None = None)
 
 
 def play_sound(sound_name: str = "message", config: NotificationConfig | None = None) -> None:
-    """Play a feedback sound using canberra-gtk-play or paplay."""
+    """Play a feedback sound via libcanberra (or the canberra-gtk-play CLI)."""
     if config and not config.sound:
         return
 
+    canberra = _canberra_context()
+    if canberra is not None:
+        lib, ctx = canberra
+        # Variadic, NULL-terminated property list; id 0 = no cancel handle
+        if lib.ca_context_play(
+            ctx, ctypes.c_uint32(0), b"event.id", sound_name.encode(), ctypes.c_char_p(None)
+        ) == 0:
+            return
+
     if _has_command("canberra-gtk-play"):
         try:
             subprocess.Popen(
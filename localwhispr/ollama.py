@@ -0,0 +1,52 @@
+"""Helpers shared by the Ollama-backed components."""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+
+import httpx
+
+
+log = logging.getLogger(__name__)
+
+
+# One component of a Go duration string as Ollama accepts it ("1h30m", "45s")
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def keep_alive_seconds(keep_alive: str | int) -> float | None:
+    """How long Ollama keeps a model loaded for a ``keep_alive`` value (None = forever).
+
+    Unparseable values give 0, i.e. the model is assumed to be unloaded.
+    """
+    value = str(keep_alive).strip()
+    try:
+        seconds = float(value)  # bare numbers are seconds
+    except ValueError:
+        if value.startswith("-"):
+            return None
+        parts = _DURATION_PART.findall(value)
+        if not parts or "".join(n + u for n, u in parts) != value:
+            return 0.0
+        seconds = sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+    return None if seconds < 0 else seconds
+
+
+def warmup(client: httpx.Client, model: str, keep_alive: str) -> None:
+    """Ask Ollama to load *model* in the background (fire-and-forget)."""
+
+    def _load() -> None:
+        try:
+            # A request without a prompt only loads the model
+            client.post(
+                "/api/generate",
+                json={"model": model, "keep_alive": keep_alive},
+                timeout=None,  # a cold load can outlast the request timeout
+            )
+        except Exception as e:
+            log.warning("Ollama warmup of %s failed: %s", model, e)
+
+    threading.Thread(target=_load, daemon=True).start()
@@ -69,9 +69,14 @@ class RecordingOverlay(Gtk.Application):
         self._start_time = start_time or datetime.now()
         self._mic_mon = WavTailMonitor(mic_wav)
         self._sys_mon = WavTailMonitor(system_wav)
+        self._buf = bytearray(WavTailMonitor.CHUNK_BYTES)  # shared tail-read buffer
         self._mic_icon: Gtk.Label | None = None
         self._sys_icon: Gtk.Label | None = None
         self._timer: Gtk.Label | None = None
+        # Last state pushed to the widgets, to skip no-op GTK updates
+        self._last_mic_active = False
+        self._last_sys_active = False
+        self._last_timer_str = "00:00"
 
     def do_activate(self) -> None:
         css = Gtk.CssProvider()
@@ -118,16 +123,30 @@ class RecordingOverlay(Gtk.Application):
 
         GLib.timeout_add(150, self._tick)
 
+    def do_shutdown(self) -> None:
+        self._mic_mon.close()
+        self._sys_mon.close()
+        Gtk.Application.do_shutdown(self)
+
     def _tick(self) -> bool:
-        mic_rms = self._mic_mon.update_raw()
-        sys_rms = self._sys_mon.update_raw()
+        mic_rms, sys_rms = (mon.update_raw_into(self._buf)
+                            for mon in (self._mic_mon, self._sys_mon))
+
+        mic_active = mic_rms > _ACTIVE_THRESHOLD
+        if mic_active != self._last_mic_active:
+            self._toggle(self._mic_icon, mic_active)
+            self._last_mic_active = mic_active
 
-        self._toggle(self._mic_icon, mic_rms > _ACTIVE_THRESHOLD)
-        self._toggle(self._sys_icon, sys_rms > _ACTIVE_THRESHOLD)
+        sys_active = sys_rms > _ACTIVE_THRESHOLD
+        if sys_active != self._last_sys_active:
+            self._toggle(self._sys_icon, sys_active)
+            self._last_sys_active = sys_active
 
         elapsed = (datetime.now() - self._start_time).total_seconds()
-        if self._timer:
-            self._timer.set_text(_format_duration(elapsed))
+        timer_str = _format_duration(elapsed)
+        if self._timer and timer_str != self._last_timer_str:
+            self._timer.set_text(timer_str)
+            self._last_timer_str = timer_str
 
         return True
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import io
+import logging
 import signal
+import struct
 import subprocess
 import tempfile
 import threading
-import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -16,6 +17,34 @@ import sounddevice as sd
 from localwhispr.config import AudioConfig
 
 
+log = logging.getLogger(__name__)
+
+# Finishes DualRecorder's mic side while its monitor side is processed; shared
+# because the daemon creates a new DualRecorder for every dictation
+_mic_stop_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lw-mic-stop")
+
+# Canonical 44-byte PCM WAV header (RIFF + fmt + data chunk headers)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _wav_bytes(chunks: list[np.ndarray], sample_rate: int, channels: int) -> memoryview:
+    """Wrap 16-bit PCM sample blocks in a WAV container with a single copy of the data."""
+    nbytes = sum(chunk.nbytes for chunk in chunks)
+    buf = bytearray(_WAV_HEADER.size + nbytes)
+    _WAV_HEADER.pack_into(
+        buf, 0,
+        b"RIFF", 36 + nbytes, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+        b"data", nbytes,
+    )
+    pos = _WAV_HEADER.size
+    for chunk in chunks:
+        end = pos + chunk.nbytes
+        buf[pos:end] = memoryview(np.ascontiguousarray(chunk)).cast("B")
+        pos = end
+    return memoryview(buf)
+
+
 class AudioRecorder:
     """Records audio from microphone in memory (WAV 16-bit PCM)."""
 
@@ -37,7 +66,7 @@ class AudioRecorder:
         with self._lock:
             if self._recording:
                 return
-            self._frames.clear()
+            self._frames = []
             self._recording = True
 
         self._stream = sd.InputStream(
@@ -49,7 +78,7 @@ class AudioRecorder:
         )
         self._stream.start()
 
-    def stop(self) -> bytes:
+    def stop(self) -> bytes | memoryview:
         """Stop recording and return WAV bytes."""
         with self._lock:
             self._recording = False
@@ -65,23 +94,18 @@ class AudioRecorder:
         self, indata: np.ndarray, frames: int, time_info: object, status: sd.CallbackFlags
     ) -> None:
         if self._recording:
+            # Only a block-sized copy here: no allocation that grows with the
+            # recording inside the real-time callback
             self._frames.append(indata.copy())
 
-    def _build_wav(self) -> bytes:
-        """Combine recorded frames into an in-memory WAV file."""
-        if not self._frames:
+    def _build_wav(self) -> bytes | memoryview:
+        """Wrap the recorded frames in an in-memory WAV file."""
+        frames, self._frames = self._frames, []
+        if not frames:
             return b""
 
-        audio_data = np.concatenate(self._frames, axis=0)
-        buf = io.BytesIO()
-
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_data.tobytes())
-
-        return buf.getvalue()
+        # Blocks are copied straight into the WAV buffer: no concatenate pass
+        return _wav_bytes(frames, self.sample_rate, self.channels)
 
 
 class DualRecorder:
@@ -115,40 +139,46 @@ class DualRecorder:
 
         # Start monitor (parecord) if available
         if monitor_source:
-            self._monitor_tmpfile = tempfile.mktemp(suffix=".wav", prefix="lw_monitor_")
+            self._monitor_tmpfile = tempfile.mktemp(suffix=".raw", prefix="lw_monitor_")
             try:
                 self._monitor_proc = subprocess.Popen(
                     [
                         "parecord",
                         "--device", monitor_source,
-                        "--file-format=wav",
+                        # Raw mono s16le at the mic's rate: PulseAudio/PipeWire
+                        # resample and downmix, nothing left to do on stop
+                        "--raw",
+                        "--format=s16le",
+                        f"--rate={self._sample_rate}",
+                        "--channels=1",
                         self._monitor_tmpfile,
                     ],
                     stdin=subprocess.DEVNULL,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.PIPE,
                 )
-                print(f"[localwhispr] Monitor source: {monitor_source}")
+                log.info("Monitor source: %s", monitor_source)
             except Exception as e:
-                print(f"[localwhispr] WARNING: failed to start parecord: {e}")
+                log.warning("Failed to start parecord: %s", e)
                 self._monitor_proc = None
         else:
-            print("[localwhispr] WARNING: no monitor source detected, capturing mic only")
+            log.warning("No monitor source detected, capturing mic only")
 
         self._recording = True
 
-    def stop(self) -> tuple[bytes, bytes]:
+    def stop(self) -> tuple[bytes | memoryview, bytes | memoryview]:
         """Stop recording and return (mic_wav_bytes, monitor_wav_bytes)."""
         if not self._recording:
             return b"", b""
 
         self._recording = False
 
-        # Stop mic
-        mic_bytes = self._mic_recorder.stop()
+        # Stop mic (stream close + WAV build) in the background: independent
+        # of stopping parecord and resampling its capture below
+        mic_future = _mic_stop_executor.submit(self._mic_recorder.stop)
 
         # Stop monitor
-        monitor_bytes = b""
+        monitor_bytes: bytes | memoryview = b""
         if self._monitor_proc and self._monitor_proc.poll() is None:
             try:
                 self._monitor_proc.send_signal(signal.SIGINT)
@@ -160,60 +190,26 @@ class DualRecorder:
                 except subprocess.TimeoutExpired:
                     self._monitor_proc.kill()
             except Exception as e:
-                print(f"[localwhispr] WARNING: error stopping monitor: {e}")
+                log.warning("Error stopping monitor: %s", e)
 
         self._monitor_proc = None
 
-        # Read and normalize the monitor WAV to mono 16kHz
+        # Wrap the raw monitor capture in a WAV header
         if self._monitor_tmpfile:
             monitor_path = Path(self._monitor_tmpfile)
             if monitor_path.exists() and monitor_path.stat().st_size > 100:
-                monitor_bytes = self._read_and_normalize(monitor_path)
-                print(f"[localwhispr] Monitor: {len(monitor_bytes)} bytes")
+                monitor_bytes = self._read_monitor(monitor_path)
+                log.info("Monitor: %s bytes", len(monitor_bytes))
             monitor_path.unlink(missing_ok=True)
             self._monitor_tmpfile = ""
 
-        return mic_bytes, monitor_bytes
+        return mic_future.result(), monitor_bytes
 
-    def _read_and_normalize(self, path: Path) -> bytes:
-        """Read parecord WAV, convert to mono 16kHz and return WAV bytes."""
+    def _read_monitor(self, path: Path) -> bytes | memoryview:
+        """Read parecord's raw capture (already mono s16le at our rate) as WAV bytes."""
         try:
-            with wave.open(str(path), "rb") as wf:
-                n_channels = wf.getnchannels()
-                sample_rate = wf.getframerate()
-                sample_width = wf.getsampwidth()
-                n_frames = wf.getnframes()
-                raw = wf.readframes(n_frames)
-
-            # Convert to int16
-            if sample_width == 4:
-                data = np.frombuffer(raw, dtype=np.int32)
-                data = (data >> 16).astype(np.int16)
-            elif sample_width == 2:
-                data = np.frombuffer(raw, dtype=np.int16)
-            else:
-                return b""
-
-            # Mono
-            if n_channels > 1:
-                data = data.reshape(-1, n_channels).mean(axis=1).astype(np.int16)
-
-            # Resample to 16kHz
-            if sample_rate != self._sample_rate:
-                duration = len(data) / sample_rate
-                target_len = int(duration * self._sample_rate)
-                indices = np.linspace(0, len(data) - 1, target_len)
-                data = np.interp(indices, np.arange(len(data)), data.astype(np.float64)).astype(np.int16)
-
-            # Export as in-memory WAV
-            buf = io.BytesIO()
-            with wave.open(buf, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(self._sample_rate)
-                wf.writeframes(data.tobytes())
-            return buf.getvalue()
-
+            data = np.fromfile(path, dtype="<i2")
+            return _wav_bytes([data], self._sample_rate, 1)
         except Exception as e:
-            print(f"[localwhispr] WARNING: error normalizing monitor WAV: {e}")
+            log.warning("Error reading monitor capture: %s", e)
             return b""
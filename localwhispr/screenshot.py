@@ -2,81 +2,198 @@
 
 from __future__ import annotations
 
-import base64
+import functools
+import json
+import logging
+import os
+import select
 import shutil
 import subprocess
 import tempfile
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import httpx
+import orjson
+from pybase64 import b64encode  # SIMD (libbase64) encoder
+
+from localwhispr import ydotool
+from localwhispr.ollama import keep_alive_seconds, warmup
 
 if TYPE_CHECKING:
     from localwhispr.config import OllamaConfig
 
 
-def _capture_screenshot() -> bytes | None:
-    """Capture screenshot of the screen. Tries multiple methods in order."""
-    # Method 1: Simulate PrintScreen via ydotool and grab from clipboard (GNOME Wayland)
-    if shutil.which("ydotool") and shutil.which("wl-paste"):
-        img = _screenshot_via_printscreen()
-        if img:
-            return img
+log = logging.getLogger(__name__)
+
+
+# Memory-backed tmpfs for the capture tools' PNG (falls back to the default tempdir)
+SCREENSHOT_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Captures above this size are downscaled and re-encoded as JPEG before upload
+SCREENSHOT_SHRINK_BYTES = 2_000_000
+SCREENSHOT_MAX_SIDE = 1536
+SCREENSHOT_JPEG_QUALITY = 85
+
+PRINTSCREEN_TIMEOUT_S = 2.0  # give GNOME up to 2s to put the capture on the clipboard
+# wl-paste --watch reports the current selection once at startup; wait this
+# long for that first notification before pressing PrintScreen
+PRINTSCREEN_WATCH_READY_S = 0.5
 
-    # Method 2: gnome-screenshot directly to file
-    if shutil.which("gnome-screenshot"):
-        img = _screenshot_via_tool(["gnome-screenshot", "-f"])
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> str | None:
+    """shutil.which, cached for the daemon's lifetime (no $PATH walk per capture)."""
+    return shutil.which(cmd)
+
+
+# Capture methods in probe order: name -> (required commands, capture function)
+_CAPTURE_METHODS: dict[str, tuple[tuple[str, ...], Callable[[], bytes | None]]] = {
+    # Simulate PrintScreen via ydotool and grab from clipboard (GNOME Wayland)
+    "printscreen": (("ydotool", "wl-paste"), lambda: _screenshot_via_printscreen()),
+    # gnome-screenshot directly to file
+    "gnome-screenshot": (("gnome-screenshot",), lambda: _screenshot_via_tool(["gnome-screenshot", "-f"])),
+    # grim (sway, other Wayland compositors)
+    "grim": (("grim",), lambda: _screenshot_via_tool(["grim"])),
+}
+
+# Method that last worked in this daemon process (not persisted: a restart
+# probes in the original order again)
+_capture_method: str | None = None
+
+
+def _capture_screenshot() -> bytes | None:
+    """Capture screenshot of the screen.
+
+    Goes straight to the method that worked last time; if it fails (or
+    nothing is known yet), tries every available method in order.
+    """
+    global _capture_method
+    if _capture_method is not None:
+        img = _CAPTURE_METHODS[_capture_method][1]()
         if img:
             return img
 
-    # Method 3: grim (sway, other Wayland compositors)
-    if shutil.which("grim"):
-        img = _screenshot_via_tool(["grim"])
+    for name, (commands, capture) in _CAPTURE_METHODS.items():
+        if name == _capture_method or not all(_which(cmd) for cmd in commands):
+            continue
+        img = capture()
         if img:
+            _capture_method = name
             return img
 
-    print("[localwhispr] ERROR: No screenshot method worked.")
-    print("[localwhispr] On GNOME 49+, LocalWhispr uses PrintScreen + clipboard.")
+    log.error("No screenshot method worked.")
+    log.info("On GNOME 49+, LocalWhispr uses PrintScreen + clipboard.")
     return None
 
 
 def _screenshot_via_printscreen() -> bytes | None:
-    """Simulate Shift+PrintScreen, GNOME captures full screen directly to clipboard."""
-    import time
+    """Simulate Shift+PrintScreen, GNOME captures full screen directly to clipboard.
 
+    A ``wl-paste --watch`` process reports clipboard changes, so the new PNG
+    is read exactly once, after GNOME has set it, without touching or
+    re-reading what the user had on the clipboard before.
+    """
+    watcher = _watch_clipboard()
     try:
+        fd = watcher.stdout.fileno()
+        # Swallow the notification for the selection that is already there
+        if _clipboard_has_content():
+            _wait_for_change(fd, PRINTSCREEN_WATCH_READY_S)
+
         # Simulate Shift+PrintScreen (Shift=42, PrintScreen=99)
         # GNOME maps Shift+Print to direct full screen capture
-        subprocess.run(
-            ["ydotool", "key", "42:1", "99:1", "99:0", "42:0"],
-            timeout=2,
-            capture_output=True,
-        )
+        keys = ("42:1", "99:1", "99:0", "42:0")
+        if not ydotool.key(*keys):
+            subprocess.run(["ydotool", "key", *keys], timeout=2, capture_output=True)
+
+        deadline = time.monotonic() + PRINTSCREEN_TIMEOUT_S
+        while (remaining := deadline - time.monotonic()) > 0:
+            if not _wait_for_change(fd, remaining):
+                break
+            # Something else may have changed the clipboard: keep waiting
+            # unless the new selection is a PNG
+            img = _read_clipboard_png()
+            if img:
+                log.info("Screenshot via Shift+PrintScreen+clipboard (%s bytes)", len(img))
+                return img
+
+        return None
+
+    except Exception as e:
+        log.warning("Screenshot via PrintScreen failed: %s", e)
+        return None
+    finally:
+        watcher.terminate()
+        try:
+            watcher.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            watcher.kill()
+        watcher.stdout.close()
+
+
+def _watch_clipboard() -> subprocess.Popen:
+    """Start ``wl-paste --watch``: one line on stdout per clipboard change.
+
+    The selection's data goes straight from its owner to ``echo``, which
+    discards it; nothing is copied through this process.
+    """
+    return subprocess.Popen(
+        ["wl-paste", "--watch", "echo"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
 
-        # Wait for GNOME to process and copy to clipboard
-        time.sleep(2.0)
 
-        # Grab the image from clipboard
+def _wait_for_change(fd: int, timeout: float) -> bool:
+    """Wait up to *timeout* for clipboard-change notifications; False on timeout/EOF."""
+    ready, _, _ = select.select([fd], [], [], timeout)
+    # Drain everything pending: several quick changes count as one
+    return bool(ready) and bool(os.read(fd, 4096))
+
+
+def _clipboard_has_content() -> bool:
+    """True when the clipboard currently holds a selection of any type."""
+    try:
         result = subprocess.run(
-            ["wl-paste", "--type", "image/png", "--no-newline"],
+            ["wl-paste", "--list-types"],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
-            timeout=3,
+            timeout=0.2,
         )
+    except subprocess.TimeoutExpired:
+        return False
+    return result.returncode == 0 and bool(result.stdout.strip())
 
-        if result.returncode == 0 and len(result.stdout) > 100:
-            print(f"[localwhispr] Screenshot via Shift+PrintScreen+clipboard ({len(result.stdout)} bytes)")
-            return result.stdout
 
-        return None
+def _read_clipboard_png() -> bytes | None:
+    """Read the PNG on the clipboard in one go.
 
-    except Exception as e:
-        print(f"[localwhispr] WARNING: screenshot via PrintScreen failed: {e}")
-        return None
+    wl-paste writes into an anonymous memory file rather than a pipe, so the
+    image is read once at its final size instead of being reassembled from
+    pipe-sized chunks.
+    """
+    fd = os.memfd_create("localwhispr-screenshot", os.MFD_CLOEXEC)
+    try:
+        result = subprocess.run(
+            ["wl-paste", "--type", "image/png", "--no-newline"],
+            stdout=fd,
+            stderr=subprocess.DEVNULL,
+            timeout=3,
+        )
+        size = os.fstat(fd).st_size
+        if result.returncode != 0 or size <= 100:
+            return None
+        return os.pread(fd, size, 0)
+    finally:
+        os.close(fd)
 
 
 def _screenshot_via_tool(cmd_prefix: list[str]) -> bytes | None:
     """Capture screenshot via CLI tool that saves to file."""
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False, dir=SCREENSHOT_TMP_DIR) as tmp:
         tmp_path = tmp.name
 
     try:
@@ -89,10 +206,12 @@ def _screenshot_via_tool(cmd_prefix: list[str]) -> bytes | None:
         if result.returncode != 0:
             return None
 
-        screenshot_path = Path(tmp_path)
-        if screenshot_path.exists() and screenshot_path.stat().st_size > 0:
-            return screenshot_path.read_bytes()
-        return None
+        fd = os.open(tmp_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            return os.pread(fd, size, 0) if size > 0 else None
+        finally:
+            os.close(fd)
 
     except Exception:
         return None
@@ -100,6 +219,29 @@ def _screenshot_via_tool(cmd_prefix: list[str]) -> bytes | None:
         Path(tmp_path).unlink(missing_ok=True)
 
 
+def _shrink_screenshot(image_bytes: bytes) -> bytes:
+    """Downscale a large capture to a vision-model-friendly JPEG.
+
+    4K captures can reach 5-15 MB of PNG; the model sees them at a much lower
+    resolution anyway, so shrinking first saves base64, JSON and upload time.
+    """
+    if len(image_bytes) <= SCREENSHOT_SHRINK_BYTES:
+        return image_bytes
+    try:
+        import io
+
+        from PIL import Image
+
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            img.thumbnail((SCREENSHOT_MAX_SIDE, SCREENSHOT_MAX_SIDE), Image.LANCZOS)
+            out = io.BytesIO()
+            img.convert("RGB").save(out, format="JPEG", quality=SCREENSHOT_JPEG_QUALITY)
+        return out.getvalue()
+    except Exception as e:
+        log.warning("Could not shrink screenshot, sending it as-is: %s", e)
+        return image_bytes
+
+
 class ScreenshotCommand:
     """Process voice commands with visual context (screenshot)."""
 
@@ -109,82 +251,132 @@ class ScreenshotCommand:
         cfg = config or OC()
         self._base_url = cfg.base_url.rstrip("/")
         self._model = cfg.vision_model
+        self._client = httpx.Client(
+            base_url=self._base_url,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=2, max_connections=4, keepalive_expiry=60),
+        )
+        self._keep_alive = cfg.keep_alive
+        # Fixed part of the screenshot request, serialized once; execute()
+        # splices in the prompt and the base64 image as bytes
+        envelope = json.dumps({
+            "model": self._model,
+            "keep_alive": self._keep_alive,
+            "stream": True,
+            "options": {
+                "temperature": 0.3,
+                "num_predict": 4096,
+            },
+        })
+        self._image_body_head = envelope.encode()[:-1] + b', "prompt": '
+        self._warmup = cfg.warmup
+        self._keep_alive_s = keep_alive_seconds(cfg.keep_alive)
+        self._last_request = float("-inf")  # monotonic time the model was last used
+        if self._warmup:
+            warmup(self._client, self._model, self._keep_alive)
+            self._last_request = time.monotonic()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection to Ollama."""
+        self._client.close()
+
+    def _model_may_be_unloaded(self) -> bool:
+        if self._keep_alive_s is None:
+            return False
+        return time.monotonic() - self._last_request >= self._keep_alive_s
+
+    def _generate(self, **request: object) -> str:
+        """POST a streamed /api/generate request and collect the response text.
+
+        Streaming lets the read timeout bound the gap between tokens instead
+        of the whole generation.
+        """
+        parts: list[str] = []
+        self._last_request = time.monotonic()
+        with self._client.stream("POST", "/api/generate", **request) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+        return "".join(parts).strip()
 
     def execute(self, voice_command: str) -> str:
         """Capture screenshot, combine with voice command and send to multimodal LLM."""
         if not voice_command.strip():
             return ""
 
+        # keep_alive expired since the last command: have Ollama reload the
+        # model while the screen is being captured
+        if self._warmup and self._model_may_be_unloaded():
+            warmup(self._client, self._model, self._keep_alive)
+
         # Capture screenshot
         screenshot_bytes = _capture_screenshot()
 
         if screenshot_bytes is None:
-            print("[localwhispr] Executing command without screenshot...")
+            log.info("Executing command without screenshot...")
             return self._text_only_command(voice_command)
 
-        # Encode as base64 for the Ollama API
-        screenshot_b64 = base64.b64encode(screenshot_bytes).decode("utf-8")
+        # Encode as base64 for the Ollama API, then drop the raw image
+        screenshot_bytes = _shrink_screenshot(screenshot_bytes)
+        screenshot_size = len(screenshot_bytes)
+        screenshot_b64 = b64encode(screenshot_bytes)
+        del screenshot_bytes
 
-        print(f"[localwhispr] Screenshot captured ({len(screenshot_bytes)} bytes)")
-        print(f"[localwhispr] Voice command: {voice_command[:80]}...")
+        log.info("Screenshot captured (%s bytes)", screenshot_size)
+        log.info("Voice command: %s...", voice_command[:80])
 
         try:
-            response = httpx.post(
-                f"{self._base_url}/api/generate",
-                json={
-                    "model": self._model,
-                    "prompt": (
-                        "You are looking at the user's computer screen. "
-                        "The user made the following voice request:\n\n"
-                        f'"{voice_command}"\n\n'
-                        "Respond directly and helpfully based on what you see on the screen "
-                        "and the user's request. Respond ONLY with the requested content, "
-                        "no extra explanations. "
-                        "IMPORTANT: Respond in the SAME LANGUAGE as the user's request."
-                    ),
-                    "images": [screenshot_b64],
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "num_predict": 4096,
-                    },
-                },
-                timeout=60.0,
+            prompt = (
+                "You are looking at the user's computer screen. "
+                "The user made the following voice request:\n\n"
+                f'"{voice_command}"\n\n'
+                "Respond directly and helpfully based on what you see on the screen "
+                "and the user's request. Respond ONLY with the requested content, "
+                "no extra explanations. "
+                "IMPORTANT: Respond in the SAME LANGUAGE as the user's request."
             )
-            response.raise_for_status()
-            data = response.json()
-            result = data.get("response", "").strip()
+            # The base64 alphabet needs no JSON escaping, so it goes in as-is
+            body = b"".join((
+                self._image_body_head,
+                json.dumps(prompt).encode(),
+                b', "images": ["',
+                screenshot_b64,
+                b'"]}',
+            ))
+            del screenshot_b64
+            result = self._generate(content=body, headers={"Content-Type": "application/json"})
 
             if result:
-                print(f"[localwhispr] AI response: {result[:100]}...")
+                log.info("AI response: %s...", result[:100])
             return result
 
         except httpx.ConnectError:
-            print(f"[localwhispr] ERROR: Could not connect to Ollama.")
+            log.error("Could not connect to Ollama.")
             return f"[ERROR: Ollama not reachable at {self._base_url}]"
         except Exception as e:
-            print(f"[localwhispr] ERROR in screenshot command: {e}")
+            log.error("Screenshot command failed: %s", e)
             return f"[ERROR: {e}]"
 
     def _text_only_command(self, voice_command: str) -> str:
         """Fallback: execute command without screenshot."""
         try:
-            response = httpx.post(
-                f"{self._base_url}/api/generate",
+            return self._generate(
                 json={
                     "model": self._model,
                     "prompt": voice_command,
-                    "stream": False,
+                    "keep_alive": self._keep_alive,
+                    "stream": True,
                     "options": {
                         "temperature": 0.3,
                         "num_predict": 4096,
                     },
                 },
-                timeout=60.0,
             )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("response", "").strip()
         except Exception as e:
-            print(f"[localwhispr] ERROR in text command: {e}")
+            log.error("Text command failed: %s", e)
             return f"[ERROR: {e}]"
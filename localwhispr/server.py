@@ -3,15 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import logging
 import os
 import shutil
 import signal
 import subprocess
 import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+
+log = logging.getLogger(__name__)
+
+
 SOCKET_PATH = Path(os.environ.get("XDG_RUNTIME_DIR", f"/run/user/{os.getuid()}")) / "localwhispr.sock"
 
+# Commands are single newline-terminated words; anything longer is a framing error
+COMMAND_LIMIT = 256
+
+# Commands answered directly on the event loop. Everything else touches
+# recorders and subprocesses (stopping pw-record, mixing audio...) and can
+# block for seconds, so it runs on the command thread instead.
+_INLINE_COMMANDS = frozenset({"ping", "quit"})
+
+# How long shutdown waits for an in-flight dictation/meeting pipeline
+PIPELINE_SHUTDOWN_TIMEOUT_S = 10.0
+
+_PONG = b"pong"
+_OK_BYE = b"OK bye"
+
 
 class LocalWhisprDaemon:
     """Daemon that listens for commands via Unix socket and orchestrates pipelines."""
@@ -19,21 +42,42 @@ class LocalWhisprDaemon:
     def __init__(self, app: "LocalWhisprApp") -> None:
         self._app = app
         self._server: asyncio.AbstractServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Single worker: commands are serialized, as they were on the loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="localwhispr-cmd")
+        self._handlers: dict[str, Callable[[], str | bytes]] = {
+            "dictate": app.toggle_dictation,
+            "screenshot": app.toggle_screenshot,
+            "meeting": app.toggle_meeting,
+            "status": app.get_status,
+            "stop": app.force_stop,
+            "ping": lambda: _PONG,
+            "quit": self._quit,
+        }
 
     async def handle_client(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
         """Process a command received via socket."""
         try:
-            data = await asyncio.wait_for(reader.read(1024), timeout=5.0)
+            try:
+                data = await asyncio.wait_for(reader.readuntil(b"\n"), timeout=5.0)
+            except asyncio.IncompleteReadError as e:
+                data = e.partial  # client closed without a newline: take what it sent
             command = data.decode().strip()
 
-            response = self._dispatch(command)
-            writer.write(response.encode())
+            if command in _INLINE_COMMANDS:
+                response = self._dispatch(command)
+            else:
+                response = await self._loop.run_in_executor(self._executor, self._dispatch, command)
+            writer.write(response)
             await writer.drain()
         except asyncio.TimeoutError:
             writer.write(b"ERR timeout")
             await writer.drain()
+        except asyncio.LimitOverrunError:
+            writer.write(b"ERR framing")
+            await writer.drain()
         except Exception as e:
             writer.write(f"ERR {e}".encode())
             await writer.drain()
@@ -41,52 +85,43 @@ class LocalWhisprDaemon:
             writer.close()
             await writer.wait_closed()
 
-    def _dispatch(self, command: str) -> str:
-        """Dispatch command to the correct action."""
-        match command:
-            case "dictate":
-                return self._app.toggle_dictation()
-            case "screenshot":
-                return self._app.toggle_screenshot()
-            case "meeting":
-                return self._app.toggle_meeting()
-            case "status":
-                return self._app.get_status()
-            case "stop":
-                return self._app.force_stop()
-            case "ping":
-                return "pong"
-            case "quit":
-                asyncio.get_event_loop().call_soon(self._shutdown)
-                return "OK bye"
-            case _:
-                return f"ERR unknown command: {command}"
+    def _dispatch(self, command: str) -> bytes:
+        """Dispatch command to the correct action and return the encoded reply."""
+        handler = self._handlers.get(command)
+        if handler is None:
+            return f"ERR unknown command: {command}".encode()
+        response = handler()
+        return response if isinstance(response, bytes) else response.encode()
+
+    def _quit(self) -> bytes:
+        self._loop.call_soon_threadsafe(self._shutdown)
+        return _OK_BYE
 
     def _shutdown(self) -> None:
         """Shut down the daemon."""
-        print("[localwhispr] Shutting down daemon...")
+        log.info("Shutting down daemon...")
         if self._server:
             self._server.close()
-        asyncio.get_event_loop().stop()
+        self._loop.stop()
 
     async def start(self) -> None:
         """Start the Unix socket server."""
+        self._loop = asyncio.get_running_loop()
+
         # Remove stale socket if it exists
-        if SOCKET_PATH.exists():
-            SOCKET_PATH.unlink()
+        SOCKET_PATH.unlink(missing_ok=True)
 
         self._server = await asyncio.start_unix_server(
-            self.handle_client, path=str(SOCKET_PATH)
+            self.handle_client, path=str(SOCKET_PATH), limit=COMMAND_LIMIT
         )
         # Permission: current user only
         SOCKET_PATH.chmod(0o600)
 
-        print(f"[localwhispr] Daemon listening on {SOCKET_PATH}")
-        print("[localwhispr] Ready! Configure GNOME shortcuts to send commands.")
-        print("[localwhispr]   Dictation:  localwhispr ctl dictate")
-        print("[localwhispr]   Screenshot: localwhispr ctl screenshot")
-        print("[localwhispr]   Meeting:    localwhispr ctl meeting")
-        print()
+        log.info("Daemon listening on %s", SOCKET_PATH)
+        log.info("Ready! Configure GNOME shortcuts to send commands.")
+        log.info("  Dictation:  localwhispr ctl dictate")
+        log.info("  Screenshot: localwhispr ctl screenshot")
+        log.info("  Meeting:    localwhispr ctl meeting")
 
         async with self._server:
             await self._server.serve_forever()
@@ -96,8 +131,9 @@ class LocalWhisprDaemon:
         if self._server:
             self._server.close()
             await self._server.wait_closed()
-        if SOCKET_PATH.exists():
-            SOCKET_PATH.unlink()
+        SOCKET_PATH.unlink(missing_ok=True)
+        self._executor.shutdown(wait=False)
+        self._app.close()
 
 
 def _merge_segments(
@@ -105,16 +141,10 @@ def _merge_segments(
     monitor_segments: list[tuple[float, float, str]],
 ) -> str:
     """Interleave mic and monitor segments by timestamp into a single text."""
-    all_segments: list[tuple[float, str]] = []
-    for start, _end, text in mic_segments:
-        all_segments.append((start, text))
-    for start, _end, text in monitor_segments:
-        all_segments.append((start, text))
-
-    # Sort by timestamp
-    all_segments.sort(key=lambda x: x[0])
-
-    return " ".join(text for _, text in all_segments)
+    # Whisper emits each track's segments in start order, so a linear merge
+    # of the two sorted lists is enough (ties keep mic first, as before)
+    merged = heapq.merge(mic_segments, monitor_segments, key=lambda seg: seg[0])
+    return " ".join(text for _start, _end, text in merged)
 
 
 class LocalWhisprApp:
@@ -149,6 +179,8 @@ class LocalWhisprApp:
         self._meeting_recorder = None
         self._dual_recorder = None  # DualRecorder for dictate with monitor
         self._overlay_proc: subprocess.Popen | None = None
+        # Post-processing pipeline in flight (one at a time, guarded by _processing)
+        self._pipeline: threading.Thread | None = None
 
     def toggle_dictation(self) -> str:
         """Toggle dictation recording."""
@@ -169,10 +201,10 @@ class LocalWhisprApp:
                     config=type("C", (), {"sample_rate": self._recorder.sample_rate, "channels": self._recorder.channels})()
                 )
                 self._dual_recorder.start()
-                print("[localwhispr] ● Recording dictation (mic + headset)...")
+                log.info("● Recording dictation (mic + headset)...")
             else:
                 self._recorder.start()
-                print("[localwhispr] ● Recording dictation...")
+                log.info("● Recording dictation...")
 
             from localwhispr.notifier import notify_recording_start
             notify_recording_start(self._notif)
@@ -196,7 +228,7 @@ class LocalWhisprApp:
             from localwhispr.notifier import notify_recording_start
             notify_recording_start(self._notif)
 
-            print("[localwhispr] ◉ Recording command + screenshot...")
+            log.info("◉ Recording command + screenshot...")
             return "OK recording"
         else:
             return f"BUSY mode={self._mode}"
@@ -213,6 +245,27 @@ class LocalWhisprApp:
         else:
             return f"BUSY mode={self._mode}"
 
+    def _start_pipeline(self, target: Callable[..., None], *args: object) -> None:
+        """Run a post-processing pipeline on a daemon thread."""
+        self._pipeline = threading.Thread(target=target, args=args, daemon=True, name="lw-pipeline")
+        self._pipeline.start()
+
+    def close(self) -> None:
+        """Release long-lived resources (HTTP connections to Ollama).
+
+        Gives a running pipeline a bounded time to finish first; if it is still
+        busy, the clients are left open under it and the daemon thread simply
+        dies with the process.
+        """
+        if self._pipeline is not None and self._pipeline.is_alive():
+            log.info("Waiting for the running pipeline to finish...")
+            self._pipeline.join(timeout=PIPELINE_SHUTDOWN_TIMEOUT_S)
+            if self._pipeline.is_alive():
+                log.warning("Pipeline still running, exiting without it.")
+                return
+        self._cleanup.close()
+        self._screenshot_cmd.close()
+
     def get_status(self) -> str:
         """Return current status."""
         if self._processing:
@@ -229,7 +282,7 @@ class LocalWhisprApp:
             self._meeting_recorder = None
             self._recording = False
             self._mode = ""
-            print("[localwhispr] ■ Meeting cancelled.")
+            log.info("■ Meeting cancelled.")
             return "OK stopped"
         elif self._recording:
             if self._dual_recorder:
@@ -239,18 +292,16 @@ class LocalWhisprApp:
                 self._recorder.stop()
             self._recording = False
             self._mode = ""
-            print("[localwhispr] ■ Recording cancelled.")
+            log.info("■ Recording cancelled.")
             return "OK stopped"
         return "OK already_idle"
 
     def _stop_and_process_dictation(self) -> str:
         """Stop recording and start dictation pipeline in a thread."""
-        import threading
-
         from localwhispr.notifier import notify_recording_stop
         notify_recording_stop(self._notif)
 
-        print("[localwhispr] ■ Stopping recording...")
+        log.info("■ Stopping recording...")
 
         if self._dual_recorder:
             mic_bytes, monitor_bytes = self._dual_recorder.stop()
@@ -258,86 +309,89 @@ class LocalWhisprApp:
             self._recording = False
 
             if (not mic_bytes or len(mic_bytes) < 1000) and (not monitor_bytes or len(monitor_bytes) < 1000):
-                print("[localwhispr] Recording too short, ignoring.")
+                log.info("Recording too short, ignoring.")
                 self._mode = ""
                 return "OK too_short"
 
             self._processing = True
-            threading.Thread(
-                target=self._process_dictation_dual, args=(mic_bytes, monitor_bytes), daemon=True
-            ).start()
+            self._start_pipeline(self._process_dictation_dual, mic_bytes, monitor_bytes)
         else:
             wav_bytes = self._recorder.stop()
             self._recording = False
 
             if not wav_bytes or len(wav_bytes) < 1000:
-                print("[localwhispr] Recording too short, ignoring.")
+                log.info("Recording too short, ignoring.")
                 self._mode = ""
                 return "OK too_short"
 
             self._processing = True
-            threading.Thread(
-                target=self._process_dictation, args=(wav_bytes,), daemon=True
-            ).start()
+            self._start_pipeline(self._process_dictation, wav_bytes)
 
         return "OK processing"
 
-    def _process_dictation(self, wav_bytes: bytes) -> None:
+    def _process_dictation(self, wav_bytes: bytes | memoryview) -> None:
         """Simple pipeline: transcription -> AI cleanup -> type."""
         from localwhispr.notifier import notify_done, notify_error
 
         try:
-            print("[localwhispr] Transcribing...")
+            log.info("Transcribing...")
             raw_text = self._transcriber.transcribe(wav_bytes)
             if not raw_text:
-                print("[localwhispr] No speech detected.")
+                log.info("No speech detected.")
                 notify_error("No speech detected", self._notif)
                 return
 
-            print("[localwhispr] Polishing with AI...")
+            log.info("Polishing with AI...")
             cleaned_text = self._cleanup.cleanup(raw_text)
 
-            print(f"[localwhispr] Typing: {cleaned_text[:80]}...")
+            log.info("Typing: %s...", cleaned_text[:80])
             self._typer.type_text(cleaned_text)
             notify_done(cleaned_text, self._notif)
 
         except Exception as e:
-            print(f"[localwhispr] ERROR in pipeline: {e}")
+            log.error("Dictation pipeline failed: %s", e)
             notify_error(str(e), self._notif)
         finally:
             self._processing = False
             self._mode = ""
 
-    def _process_dictation_dual(self, mic_bytes: bytes, monitor_bytes: bytes) -> None:
+    def _process_dictation_dual(self, mic_bytes: bytes | memoryview, monitor_bytes: bytes | memoryview) -> None:
         """Dual pipeline: transcribe mic + monitor separately, merge by timestamp, cleanup, type."""
         from localwhispr.notifier import notify_done, notify_error
 
         try:
-            print("[localwhispr] Transcribing mic...")
-            mic_segments = self._transcriber.transcribe_with_timestamps(mic_bytes) if mic_bytes and len(mic_bytes) > 1000 else []
-
-            print("[localwhispr] Transcribing headset...")
-            monitor_segments = self._transcriber.transcribe_with_timestamps(monitor_bytes) if monitor_bytes and len(monitor_bytes) > 1000 else []
+            # Both tracks at once: ctranslate2 releases the GIL while decoding
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="lw-transcribe") as ex:
+                mic_future = monitor_future = None
+                if mic_bytes and len(mic_bytes) > 1000:
+                    log.info("Transcribing mic...")
+                    mic_future = ex.submit(self._transcriber.transcribe_with_timestamps, mic_bytes)
+                if monitor_bytes and len(monitor_bytes) > 1000:
+                    log.info("Transcribing headset...")
+                    monitor_future = ex.submit(self._transcriber.transcribe_with_timestamps, monitor_bytes)
+
+                mic_segments = mic_future.result() if mic_future else []
+                monitor_segments = monitor_future.result() if monitor_future else []
 
             if not mic_segments and not monitor_segments:
-                print("[localwhispr] No speech detected.")
+                log.info("No speech detected.")
                 notify_error("No speech detected", self._notif)
                 return
 
             # Merge interleaved by timestamp (no labels)
             merged_text = _merge_segments(mic_segments, monitor_segments)
-            print(f"[localwhispr] Merged text: {merged_text[:120]}...")
+            log.info("Merged text: %s...", merged_text[:120])
 
             # AI cleanup (standard, no labels)
-            print("[localwhispr] Polishing with AI...")
+            log.info("Polishing with AI...")
             cleaned_text = self._cleanup.cleanup(merged_text)
 
-            print(f"[localwhispr] Typing: {cleaned_text[:80]}...")
+            log.info("Typing: %s...", cleaned_text[:80])
             self._typer.type_text(cleaned_text)
             notify_done(cleaned_text, self._notif)
 
         except Exception as e:
-            print(f"[localwhispr] ERROR in dual pipeline: {e}")
+            log.error("Dual pipeline failed: %s", e)
             notify_error(str(e), self._notif)
         finally:
             self._processing = False
@@ -345,50 +399,46 @@ class LocalWhisprApp:
 
     def _stop_and_process_screenshot(self) -> str:
         """Stop recording and start screenshot pipeline in a thread."""
-        import threading
-
         from localwhispr.notifier import notify_recording_stop
         notify_recording_stop(self._notif)
 
-        print("[localwhispr] ■ Stopping command recording...")
+        log.info("■ Stopping command recording...")
         wav_bytes = self._recorder.stop()
         self._recording = False
 
         if not wav_bytes or len(wav_bytes) < 1000:
-            print("[localwhispr] Recording too short, ignoring.")
+            log.info("Recording too short, ignoring.")
             self._mode = ""
             return "OK too_short"
 
         self._processing = True
-        threading.Thread(
-            target=self._process_screenshot, args=(wav_bytes,), daemon=True
-        ).start()
+        self._start_pipeline(self._process_screenshot, wav_bytes)
         return "OK processing"
 
-    def _process_screenshot(self, wav_bytes: bytes) -> None:
+    def _process_screenshot(self, wav_bytes: bytes | memoryview) -> None:
         """Pipeline: transcription -> screenshot + multimodal LLM -> type."""
         from localwhispr.notifier import notify_done, notify_error
 
         try:
-            print("[localwhispr] Transcribing command...")
+            log.info("Transcribing command...")
             command_text = self._transcriber.transcribe(wav_bytes)
             if not command_text:
-                print("[localwhispr] No command detected.")
+                log.info("No command detected.")
                 notify_error("No command detected", self._notif)
                 return
 
-            print(f"[localwhispr] Executing: {command_text[:80]}...")
+            log.info("Executing: %s...", command_text[:80])
             result = self._screenshot_cmd.execute(command_text)
 
             if result:
-                print(f"[localwhispr] Typing response: {result[:80]}...")
+                log.info("Typing response: %s...", result[:80])
                 self._typer.type_text(result)
                 notify_done(result, self._notif)
             else:
                 notify_error("AI returned no response", self._notif)
 
         except Exception as e:
-            print(f"[localwhispr] ERROR in screenshot pipeline: {e}")
+            log.error("Screenshot pipeline failed: %s", e)
             notify_error(str(e), self._notif)
         finally:
             self._processing = False
@@ -427,14 +477,14 @@ class LocalWhisprApp:
             if started_at:
                 cmd.extend(["--start-time", started_at.isoformat()])
 
-            env = {**os.environ, "PYTHONPATH": project_root}
+            # The overlay only reads WAV levels: skip the CUDA dlopen loop
+            env = {**os.environ, "PYTHONPATH": project_root,
+                   "LOCALWHISPR_SKIP_CUDA_PRELOAD": "1"}
 
             self._overlay_proc = subprocess.Popen(cmd, env=env)
-            print(f"[localwhispr] Overlay started (pid={self._overlay_proc.pid})",
-                  flush=True)
+            log.info("Overlay started (pid=%s)", self._overlay_proc.pid)
         except Exception as e:
-            print(f"[localwhispr] WARNING: failed to start overlay: {e}",
-                  flush=True)
+            log.warning("Failed to start overlay: %s", e)
             self._overlay_proc = None
 
     def _kill_overlay(self) -> None:
@@ -447,7 +497,7 @@ class LocalWhisprApp:
                 self._overlay_proc.kill()
             except Exception:
                 pass
-            print("[localwhispr] Overlay closed")
+            log.info("Overlay closed")
         self._overlay_proc = None
 
     # -- Meeting mode --------------------------------------------------------
@@ -464,14 +514,14 @@ class LocalWhisprApp:
             self._meeting_recorder = MeetingRecorder(self._meeting_config)
             output_dir = self._meeting_recorder.start()
         except RuntimeError as e:
-            print(f"[localwhispr] ERROR starting meeting: {e}")
+            log.error("Starting meeting failed: %s", e)
             return f"ERR {e}"
 
         self._mode = "meeting"
         self._recording = True
 
         play_sound("device-added", self._notif)
-        print(f"[localwhispr] ● Recording meeting in {output_dir}", flush=True)
+        log.info("● Recording meeting in %s", output_dir)
 
         self._spawn_overlay()
 
@@ -479,7 +529,6 @@ class LocalWhisprApp:
 
     def _stop_and_process_meeting(self) -> str:
         """Stop meeting recording and start post-processing."""
-        import threading
         from localwhispr.notifier import play_sound
 
         if not self._meeting_recorder:
@@ -489,7 +538,7 @@ class LocalWhisprApp:
 
         self._kill_overlay()
 
-        print("[localwhispr] ■ Stopping meeting recording...")
+        log.info("■ Stopping meeting recording...")
         play_sound("device-removed", self._notif)
 
         files = self._meeting_recorder.stop()
@@ -501,9 +550,7 @@ class LocalWhisprApp:
             return "ERR meeting_no_files"
 
         self._processing = True
-        threading.Thread(
-            target=self._process_meeting, args=(files,), daemon=True
-        ).start()
+        self._start_pipeline(self._process_meeting, files)
         return "OK meeting_processing"
 
     def _process_meeting(self, files) -> None:
@@ -537,7 +584,7 @@ class LocalWhisprApp:
                 notify_error("No content generated from meeting", self._notif)
 
         except Exception as e:
-            print(f"[localwhispr] ERROR in meeting pipeline: {e}")
+            log.error("Meeting pipeline failed: %s", e)
             notify_error(f"Meeting error: {e}", self._notif)
         finally:
             self._processing = False
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import json
+import ast
+import configparser
 import shutil
 import subprocess
 import sys
@@ -12,9 +13,6 @@ SCHEMA = "org.gnome.settings-daemon.plugins.media-keys"
 KEY = "custom-keybindings"
 BASE_PATH = "/org/gnome/settings-daemon/plugins/media-keys/custom-keybindings"
 
-# Find the localwhispr binary in PATH
-LOCALWHISPR_BIN = shutil.which("localwhispr")
-
 
 def _run_gsettings(*args: str) -> str:
     """Execute gsettings and return stdout."""
@@ -40,18 +38,38 @@ def _get_existing_custom_keybindings() -> list[str]:
     if raw in ("@as []", "[]", ""):
         return []
     try:
-        return json.loads(raw.replace("'", '"'))
-    except json.JSONDecodeError:
+        # gsettings prints a Python-compatible list literal: ['/path/a/', ...]
+        return ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
         return []
 
 
-def _find_localwhispr_slots(existing: list[str]) -> dict[str, str]:
+def _dump_keybindings() -> configparser.ConfigParser:
+    """Read every custom keybinding with a single `dconf dump`."""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.optionxform = str  # keep dconf key names as-is
+    try:
+        parser.read_string(_run_dconf("dump", f"{BASE_PATH}/"))
+    except configparser.Error:
+        pass
+    return parser
+
+
+def _section_for(path: str) -> str:
+    """Map a keybinding path to its section name in the dconf dump ("customN")."""
+    return path.removeprefix(f"{BASE_PATH}/").rstrip("/")
+
+
+def _find_localwhispr_slots(existing: list[str], dump: configparser.ConfigParser) -> dict[str, str]:
     """Find slots already used by LocalWhispr."""
     slots = {}
     for path in existing:
-        name = _run_dconf("read", f"{path}name")
+        section = _section_for(path)
+        if not dump.has_section(section):
+            continue
+        name = dump[section].get("name", "")
         if "LocalWhispr" in name:
-            cmd = _run_dconf("read", f"{path}command")
+            cmd = dump[section].get("command", "")
             if "toggle-service" in cmd.lower() or "Toggle" in name:
                 slots["toggle_service"] = path
             elif "dictate" in cmd:
@@ -78,16 +96,20 @@ def _next_slot_index(existing: list[str]) -> int:
     return i
 
 
-def _write_keybinding(path: str, name: str, command: str, binding: str) -> None:
-    """Write a custom keybinding via dconf."""
-    # dconf expects GVariant string format: 'value' with inner quotes escaped
-    def _gvariant_str(s: str) -> str:
-        escaped = s.replace("'", "\\'")
-        return f"'{escaped}'"
+def _gvariant_str(s: str) -> str:
+    """Quote a string as a GVariant literal, as dconf expects."""
+    escaped = s.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
 
-    subprocess.run(["dconf", "write", f"{path}name", _gvariant_str(name)], check=True)
-    subprocess.run(["dconf", "write", f"{path}command", _gvariant_str(command)], check=True)
-    subprocess.run(["dconf", "write", f"{path}binding", _gvariant_str(binding)], check=True)
+
+def _keybinding_entry(path: str, name: str, command: str, binding: str) -> str:
+    """Render one keybinding as a section of a `dconf load` keyfile."""
+    return (
+        f"[{_section_for(path)}]\n"
+        f"name={_gvariant_str(name)}\n"
+        f"command={_gvariant_str(command)}\n"
+        f"binding={_gvariant_str(binding)}\n"
+    )
 
 
 def setup_gnome_shortcuts(
@@ -103,10 +125,9 @@ def setup_gnome_shortcuts(
         print("[localwhispr] Install with: sudo pacman -S dconf")
         sys.exit(1)
 
-    # Determine base command
-    if LOCALWHISPR_BIN:
-        base_cmd = LOCALWHISPR_BIN
-    else:
+    # Determine base command: the localwhispr binary in PATH
+    base_cmd = shutil.which("localwhispr")
+    if not base_cmd:
         # Fallback: use current venv path
         import os
         venv = os.environ.get("VIRTUAL_ENV")
@@ -129,9 +150,10 @@ def setup_gnome_shortcuts(
     meeting_cmd = f"{base_cmd} ctl meeting"
 
     existing = _get_existing_custom_keybindings()
-    lw_slots = _find_localwhispr_slots(existing)
+    lw_slots = _find_localwhispr_slots(existing, _dump_keybindings())
 
     new_paths = list(existing)
+    entries: list[str] = []
 
     # --- Toggle service shortcut ---
     if "toggle_service" in lw_slots:
@@ -143,7 +165,7 @@ def setup_gnome_shortcuts(
         new_paths.append(path)
         print(f"[localwhispr] Creating toggle service shortcut at {path}")
 
-    _write_keybinding(path, "LocalWhispr Toggle Service", toggle_service_cmd, toggle_service_binding)
+    entries.append(_keybinding_entry(path, "LocalWhispr Toggle Service", toggle_service_cmd, toggle_service_binding))
     print(f"  → {toggle_service_binding} → toggle service on/off")
 
     # --- Dictation shortcut ---
@@ -156,7 +178,7 @@ def setup_gnome_shortcuts(
         new_paths.append(path)
         print(f"[localwhispr] Creating dictation shortcut at {path}")
 
-    _write_keybinding(path, "LocalWhispr Dictation", dictate_cmd, dictate_binding)
+    entries.append(_keybinding_entry(path, "LocalWhispr Dictation", dictate_cmd, dictate_binding))
     print(f"  → {dictate_binding} → {dictate_cmd}")
 
     # --- Screenshot shortcut ---
@@ -169,7 +191,7 @@ def setup_gnome_shortcuts(
         new_paths.append(path)
         print(f"[localwhispr] Creating screenshot shortcut at {path}")
 
-    _write_keybinding(path, "LocalWhispr Screenshot", screenshot_cmd, screenshot_binding)
+    entries.append(_keybinding_entry(path, "LocalWhispr Screenshot", screenshot_cmd, screenshot_binding))
     print(f"  → {screenshot_binding} → {screenshot_cmd}")
 
     # --- Meeting shortcut ---
@@ -182,9 +204,17 @@ def setup_gnome_shortcuts(
         new_paths.append(path)
         print(f"[localwhispr] Creating meeting shortcut at {path}")
 
-    _write_keybinding(path, "LocalWhispr Meeting", meeting_cmd, meeting_binding)
+    entries.append(_keybinding_entry(path, "LocalWhispr Meeting", meeting_cmd, meeting_binding))
     print(f"  → {meeting_binding} → {meeting_cmd}")
 
+    # --- Write all shortcuts at once ---
+    subprocess.run(
+        ["dconf", "load", f"{BASE_PATH}/"],
+        input="\n".join(entries),
+        text=True,
+        check=True,
+    )
+
     # --- Update custom keybindings list ---
     paths_str = str(new_paths).replace('"', "'")
     subprocess.run(
@@ -3,61 +3,137 @@
 from __future__ import annotations
 
 import io
+import logging
+import threading
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from faster_whisper import WhisperModel
+import numpy as np
 
 if TYPE_CHECKING:
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
     from localwhispr.config import WhisperConfig
 
 
+log = logging.getLogger(__name__)
+
+
+def transcribe_kwargs(cfg: WhisperConfig) -> dict[str, Any]:
+    """Keyword arguments for ``WhisperModel.transcribe`` derived from the config."""
+    return {
+        "language": cfg.language or None,
+        "beam_size": cfg.beam_size,
+        "vad_filter": True,
+        "vad_parameters": {
+            "min_silence_duration_ms": cfg.vad_min_silence_ms,
+            "speech_pad_ms": cfg.vad_speech_pad_ms,
+        },
+    }
+
+
+WHISPER_SAMPLE_RATE = 16000
+
+
+def _decode_pcm16_mono(wav_bytes: bytes | memoryview) -> np.ndarray | None:
+    """Decode a 16 kHz mono 16-bit PCM WAV straight into float32 samples.
+
+    Returns None for any other layout, letting faster-whisper decode (and
+    resample) the file itself.
+    """
+    mv = memoryview(wav_bytes)
+    if len(mv) < 44 or mv[:4] != b"RIFF" or mv[8:12] != b"WAVE":
+        return None
+
+    fmt_ok = False
+    pos = 12
+    while pos + 8 <= len(mv):
+        chunk_id = mv[pos : pos + 4]
+        chunk_size = int.from_bytes(mv[pos + 4 : pos + 8], "little")
+        body = pos + 8
+
+        if chunk_id == b"fmt ":
+            audio_format = int.from_bytes(mv[body : body + 2], "little")
+            channels = int.from_bytes(mv[body + 2 : body + 4], "little")
+            rate = int.from_bytes(mv[body + 4 : body + 8], "little")
+            bits = int.from_bytes(mv[body + 14 : body + 16], "little")
+            fmt_ok = (audio_format, channels, rate, bits) == (1, 1, WHISPER_SAMPLE_RATE, 16)
+        elif chunk_id == b"data":
+            if not fmt_ok:
+                return None
+            # Streamed WAVs may carry a placeholder size: clamp to what we have
+            n_bytes = min(chunk_size, len(mv) - body) & ~1
+            pcm = np.frombuffer(mv, dtype=np.int16, count=n_bytes // 2, offset=body)
+            # One fused int16 -> scaled float32 pass, no intermediate array
+            return np.multiply(pcm, np.float32(1.0 / 32768.0), dtype=np.float32)
+
+        pos = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
 class Transcriber:
     """Wrapper over faster-whisper with CUDA support."""
 
-    def __init__(self, config: WhisperConfig | None = None) -> None:
+    def __init__(self, config: WhisperConfig | None = None, num_workers: int = 1) -> None:
+        """*num_workers* > 1 lets that many threads decode concurrently (costs memory)."""
         from localwhispr.config import WhisperConfig as WC
 
         cfg = config or WC()
-        self._language = cfg.language
         self._model: WhisperModel | None = None
+        self._batched: BatchedInferencePipeline | None = None
         self._model_name = cfg.model
         self._device = cfg.device
         self._compute_type = cfg.compute_type
+        self._num_workers = num_workers
+        self._transcribe_kwargs = transcribe_kwargs(cfg)
+        self._model_lock = threading.Lock()
 
     def _ensure_model(self) -> WhisperModel:
         if self._model is None:
-            print(
-                f"[localwhispr] Loading Whisper model '{self._model_name}' "
-                f"(device={self._device}, compute={self._compute_type})..."
-            )
-            t0 = time.time()
-            self._model = WhisperModel(
-                self._model_name,
-                device=self._device,
-                compute_type=self._compute_type,
-            )
-            print(f"[localwhispr] Model loaded in {time.time() - t0:.1f}s")
+            with self._model_lock:
+                if self._model is None:  # another thread may have loaded it meanwhile
+                    # Deferred: pulls in ctranslate2 and the CUDA libraries
+                    from faster_whisper import WhisperModel
+
+                    log.info(
+                        "Loading Whisper model '%s' (device=%s, compute=%s)...",
+                        self._model_name,
+                        self._device,
+                        self._compute_type,
+                    )
+                    t0 = time.time()
+                    self._model = WhisperModel(
+                        self._model_name,
+                        device=self._device,
+                        compute_type=self._compute_type,
+                        num_workers=self._num_workers,
+                    )
+                    log.info("Model loaded in %.1fs", time.time() - t0)
         return self._model
 
-    def transcribe(self, wav_bytes: bytes) -> str:
+    def _ensure_batched(self) -> BatchedInferencePipeline:
+        """Batched pipeline over the shared model (for long meeting audio)."""
+        if self._batched is None:
+            model = self._ensure_model()
+            with self._model_lock:
+                if self._batched is None:
+                    from faster_whisper import BatchedInferencePipeline
+
+                    self._batched = BatchedInferencePipeline(model=model)
+        return self._batched
+
+    def transcribe(self, wav_bytes: bytes | memoryview) -> str:
         """Transcribe WAV bytes and return text."""
         if not wav_bytes:
             return ""
 
         model = self._ensure_model()
-        audio_file = io.BytesIO(wav_bytes)
-
-        segments, info = model.transcribe(
-            audio_file,
-            language=self._language if self._language else None,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=500,
-                speech_pad_ms=300,
-            ),
-        )
+        audio = _decode_pcm16_mono(wav_bytes)
+        if audio is None:
+            audio = io.BytesIO(wav_bytes)
+
+        segments, info = model.transcribe(audio, **self._transcribe_kwargs)
 
         text_parts: list[str] = []
         for segment in segments:
@@ -65,35 +141,30 @@ class Transcriber:
 
         result = " ".join(text_parts).strip()
         if result:
-            print(f"[localwhispr] Transcription: {result[:100]}...")
+            log.info("Transcription: %s...", result[:100])
         return result
 
-    def transcribe_with_timestamps(self, wav_bytes: bytes) -> list[tuple[float, float, str]]:
+    def transcribe_with_timestamps(self, wav_bytes: bytes | memoryview) -> list[tuple[float, float, str]]:
         """Transcribe WAV bytes and return segments with timestamps: [(start, end, text), ...]."""
         if not wav_bytes:
             return []
 
         model = self._ensure_model()
-        audio_file = io.BytesIO(wav_bytes)
-
-        segments, info = model.transcribe(
-            audio_file,
-            language=self._language if self._language else None,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=500,
-                speech_pad_ms=300,
-            ),
-        )
+        audio = _decode_pcm16_mono(wav_bytes)
+        if audio is None:
+            audio = io.BytesIO(wav_bytes)
+
+        segments, info = model.transcribe(audio, **self._transcribe_kwargs)
 
         result: list[tuple[float, float, str]] = []
+        head = ""  # first ~100 chars, for the log line
         for segment in segments:
             text = segment.text.strip()
             if text:
                 result.append((segment.start, segment.end, text))
+                if len(head) < 100:
+                    head = f"{head} {text}" if head else text
 
         if result:
-            total_text = " ".join(t for _, _, t in result)
-            print(f"[localwhispr] Transcription ({len(result)} segs): {total_text[:100]}...")
+            log.info("Transcription (%s segs): %s...", len(result), head[:100])
         return result
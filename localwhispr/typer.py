@@ -2,19 +2,51 @@
 
 from __future__ import annotations
 
+import functools
+import logging
 import shutil
 import subprocess
 import time
 from typing import TYPE_CHECKING
 
+from localwhispr import ydotool
+
 if TYPE_CHECKING:
     from localwhispr.config import TypingConfig
 
 
+log = logging.getLogger(__name__)
+
+
+PASTE_KEYS = ("29:1", "47:1", "47:0", "29:0")  # Ctrl+V (LeftCtrl=29, V=47)
+
+CLIPBOARD_POLL_INTERVAL_S = 0.01
+# Longest wait before pasting (the old fixed delay); also used as a plain
+# sleep when wl-paste isn't available to check readiness
+CLIPBOARD_WAIT_S = 0.15
+
+# The wl-copy currently owning the clipboard, shared by all Typer instances so
+# a new copy always replaces the previous owner instead of leaving it running
+_wl_copy_proc: subprocess.Popen | None = None
+
+
+@functools.lru_cache(maxsize=None)
 def _has_command(cmd: str) -> bool:
+    # Cached for the daemon's lifetime: a $PATH walk per paste is wasted work
     return shutil.which(cmd) is not None
 
 
+def _kill_prev_wl_copy() -> None:
+    """Kill the previous wl-copy process, if it exists."""
+    proc = _wl_copy_proc
+    if proc and proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
 class Typer:
     """Types text into the currently focused app using Wayland tools."""
 
@@ -26,12 +58,22 @@ class Typer:
         self._delay_ms = cfg.delay_ms
         self._validated = False
 
+        # Tool choice for the clipboard path is fixed for the daemon's lifetime
+        self._have_wl_copy = _has_command("wl-copy")
+        self._have_wl_paste = _has_command("wl-paste")
+        if _has_command("ydotool"):
+            self._paste_cmd: tuple[str, ...] | None = ("ydotool", "key", *PASTE_KEYS)
+        elif _has_command("wtype"):
+            self._paste_cmd = ("wtype", "-M", "ctrl", "-k", "v")
+        else:
+            self._paste_cmd = None
+
     def _validate(self) -> None:
         if self._validated:
             return
 
         if self._method == "ydotool" and not _has_command("ydotool"):
-            print("[localwhispr] WARNING: ydotool not found, trying wtype...")
+            log.warning("ydotool not found, trying wtype...")
             if _has_command("wtype"):
                 self._method = "wtype"
             else:
@@ -40,7 +82,7 @@ class Typer:
                     "Install ydotool or wtype: sudo pacman -S ydotool wtype"
                 )
         elif self._method == "wtype" and not _has_command("wtype"):
-            print("[localwhispr] WARNING: wtype not found, trying ydotool...")
+            log.warning("wtype not found, trying ydotool...")
             if _has_command("ydotool"):
                 self._method = "ydotool"
             else:
@@ -73,20 +115,20 @@ class Typer:
             if result.returncode != 0:
                 stderr = result.stderr.decode().strip()
                 if "failed to connect" in stderr.lower() or "socket" in stderr.lower():
-                    print("[localwhispr] ERROR: ydotoold is not running.")
-                    print("[localwhispr] Run: systemctl --user enable --now ydotool")
+                    log.error("ydotoold is not running.")
+                    log.info("Run: systemctl --user enable --now ydotool")
                     # Fallback to clipboard
                     self._type_clipboard(text)
                 else:
-                    print(f"[localwhispr] ERROR ydotool: {stderr}")
+                    log.error("ydotool failed: %s", stderr)
                     self._type_clipboard(text)
         except FileNotFoundError:
-            print("[localwhispr] ERROR: ydotool not found.")
+            log.error("ydotool not found.")
             self._type_clipboard(text)
         except subprocess.TimeoutExpired:
-            print("[localwhispr] ERROR: ydotool timeout.")
+            log.error("ydotool timeout.")
         except Exception as e:
-            print(f"[localwhispr] ERROR ydotool: {e}")
+            log.error("ydotool failed: %s", e)
             self._type_clipboard(text)
 
     def _type_wtype(self, text: str) -> None:
@@ -98,10 +140,10 @@ class Typer:
                 timeout=30,
             )
             if result.returncode != 0:
-                print(f"[localwhispr] ERROR wtype: {result.stderr.decode().strip()}")
+                log.error("wtype failed: %s", result.stderr.decode().strip())
                 self._type_clipboard(text)
         except Exception as e:
-            print(f"[localwhispr] ERROR wtype: {e}")
+            log.error("wtype failed: %s", e)
             self._type_clipboard(text)
 
     def _type_clipboard(self, text: str) -> None:
@@ -110,59 +152,74 @@ class Typer:
         The wl-copy process stays alive to keep the text in the clipboard,
         allowing the user to paste again with Ctrl+V.
         """
-        print("[localwhispr] Typing via clipboard + Ctrl+V")
+        global _wl_copy_proc
+        log.info("Typing via clipboard + Ctrl+V")
         try:
-            if not _has_command("wl-copy"):
-                print("[localwhispr] ERROR: wl-copy not found. Install: sudo pacman -S wl-clipboard")
+            if not self._have_wl_copy:
+                log.error("wl-copy not found. Install: sudo pacman -S wl-clipboard")
                 return
 
             # Kill previous wl-copy (if exists) before starting a new one
-            self._kill_prev_wl_copy()
+            _kill_prev_wl_copy()
 
             # wl-copy on Wayland is a "clipboard owner" -- needs to stay alive
             # to keep content in clipboard. We keep it alive until next use.
-            self._wl_copy_proc = subprocess.Popen(
+            _wl_copy_proc = subprocess.Popen(
                 ["wl-copy", "--", text],
                 stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
             )
 
-            # Brief wait for clipboard to register
-            time.sleep(0.15)
+            # Wait until the clipboard actually holds the text
+            self._wait_for_clipboard(text)
 
             # Simulate Ctrl+V to paste
             paste_ok = False
-            if _has_command("ydotool"):
+            if self._paste_cmd is not None and self._paste_cmd[0] == "ydotool":
+                # Straight to ydotoold's socket; the CLI only if that fails
+                paste_ok = ydotool.key(*PASTE_KEYS)
+            if not paste_ok and self._paste_cmd is not None:
                 result = subprocess.run(
-                    ["ydotool", "key", "29:1", "47:1", "47:0", "29:0"],
-                    capture_output=True,
-                    timeout=10,
-                )
-                paste_ok = result.returncode == 0
-            elif _has_command("wtype"):
-                result = subprocess.run(
-                    ["wtype", "-M", "ctrl", "-k", "v"],
-                    capture_output=True,
+                    self._paste_cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=10,
                 )
                 paste_ok = result.returncode == 0
 
             if not paste_ok:
-                print("[localwhispr] WARNING: failed to simulate Ctrl+V. Text is in clipboard, paste manually.")
+                log.warning("Failed to simulate Ctrl+V. Text is in clipboard, paste manually.")
 
             # DO NOT kill wl-copy — it stays alive to keep clipboard persistent.
             # Will be killed only when new text is copied.
 
         except Exception as e:
-            print(f"[localwhispr] ERROR in clipboard: {e}")
+            log.error("Clipboard paste failed: %s", e)
+
+    def _wait_for_clipboard(self, text: str) -> None:
+        """Poll wl-paste until wl-copy has taken ownership of the clipboard.
 
-    def _kill_prev_wl_copy(self) -> None:
-        """Kill the previous wl-copy process, if it exists."""
-        proc = getattr(self, "_wl_copy_proc", None)
-        if proc and proc.poll() is None:
-            proc.terminate()
+        wl-copy usually registers within a few ms; the wait never exceeds the
+        fixed 150ms sleep this replaces, even if the readback never matches.
+        """
+        if not self._have_wl_paste:
+            time.sleep(CLIPBOARD_WAIT_S)
+            return
+
+        expected = text.encode()
+        deadline = time.monotonic() + CLIPBOARD_WAIT_S
+        while (remaining := deadline - time.monotonic()) > 0:
             try:
-                proc.wait(timeout=2)
+                result = subprocess.run(
+                    ["wl-paste", "--no-newline"],
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    timeout=remaining,
+                )
+                if result.returncode == 0 and result.stdout == expected:
+                    return
             except subprocess.TimeoutExpired:
-                proc.kill()
+                pass
+            time.sleep(CLIPBOARD_POLL_INTERVAL_S)
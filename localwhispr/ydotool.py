@@ -0,0 +1,77 @@
+"""Send key events straight to the ydotoold socket, without spawning ydotool."""
+
+from __future__ import annotations
+
+import os
+import socket
+import struct
+import threading
+import time
+from pathlib import Path
+
+# struct input_event: struct timeval (zeroed, ydotoold ignores it), type, code, value
+_INPUT_EVENT = struct.Struct("llHHi")
+_EV_SYN = 0
+_EV_KEY = 1
+_SYN_REPORT = 0
+
+KEY_DELAY_S = 0.012  # same default as `ydotool key --key-delay 12`
+
+_lock = threading.Lock()
+_sock: socket.socket | None = None
+
+
+def _socket_path() -> Path | None:
+    """Locate ydotoold's socket the same way the ydotool client does."""
+    env = os.environ.get("YDOTOOL_SOCKET")
+    if env:
+        return Path(env)
+    candidates = [Path("/tmp/.ydotool_socket")]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        candidates.insert(0, Path(runtime_dir) / ".ydotool_socket")
+    for path in candidates:
+        if path.exists():
+            return path
+    return None
+
+
+def _connect() -> socket.socket | None:
+    global _sock
+    if _sock is None:
+        path = _socket_path()
+        if path is None:
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            sock.close()
+            return None
+        _sock = sock
+    return _sock
+
+
+def key(*events: str, delay_s: float = KEY_DELAY_S) -> bool:
+    """Emit key events written like ydotool's CLI, e.g. ``key("29:1", "47:1", "47:0", "29:0")``.
+
+    Returns False when ydotoold can't be reached, so the caller can fall back
+    to running the ``ydotool`` binary.
+    """
+    global _sock
+    with _lock:
+        sock = _connect()
+        if sock is None:
+            return False
+        try:
+            for event in events:
+                code, state = event.split(":")
+                sock.send(_INPUT_EVENT.pack(0, 0, _EV_KEY, int(code), int(state)))
+                sock.send(_INPUT_EVENT.pack(0, 0, _EV_SYN, _SYN_REPORT, 0))
+                time.sleep(delay_s)
+        except OSError:
+            # ydotoold restarted or went away: reconnect on the next call
+            sock.close()
+            _sock = None
+            return False
+    return True
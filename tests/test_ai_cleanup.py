@@ -0,0 +1,79 @@
+import httpx
+import pytest
+
+from localwhispr.ai_cleanup import AICleanup
+from localwhispr.config import OllamaConfig
+
+
+def _cleanup(handler, **overrides) -> AICleanup:
+    config = OllamaConfig(warmup=False, **overrides)
+    cleanup = AICleanup(config)
+    cleanup._client = httpx.Client(base_url="http://ollama", transport=httpx.MockTransport(handler))
+    return cleanup
+
+
+def _stream(*lines: bytes):
+    def handler(request):
+        handler.calls += 1
+        return httpx.Response(200, content=b"\n".join(lines) + b"\n")
+
+    handler.calls = 0
+    return handler
+
+
+def _unreachable(request):
+    raise AssertionError("Ollama should not be called")
+
+
+def test_stream_cut_off_before_done_returns_raw_text():
+    handler = _stream(b'{"response": " Hello"}')
+    assert _cleanup(handler, bypass_max_chars=0).cleanup("hello there") == "hello there"
+
+
+def test_unreachable_ollama_returns_raw_text():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    assert _cleanup(handler, bypass_max_chars=0).cleanup("hello there") == "hello there"
+
+
+def test_empty_response_returns_raw_text():
+    handler = _stream(b'{"response": "  ", "done": true}')
+    assert _cleanup(handler, bypass_max_chars=0).cleanup("hello there") == "hello there"
+
+
+@pytest.mark.parametrize("text", ["", "   "])
+def test_blank_text(text):
+    assert _cleanup(_unreachable).cleanup(text) == ""
+
+
+def test_short_text_bypasses_the_llm():
+    assert _cleanup(_unreachable).cleanup("  ok  ") == "ok"
+
+
+def test_short_text_with_hesitation_is_cleaned():
+    handler = _stream(b'{"response": "Yes.", "done": true}')
+    assert _cleanup(handler).cleanup("uh yes") == "Yes."
+    assert handler.calls == 1
+
+
+def test_complete_stream_is_joined_and_cached():
+    handler = _stream(
+        b'{"response": " Hello"}',
+        b'{"response": " there."}',
+        b'{"response": "", "done": true}',
+    )
+    cleanup = _cleanup(handler, bypass_max_chars=0)
+
+    assert cleanup.cleanup("hello there") == "Hello there."
+    assert cleanup.cleanup("hello there") == "Hello there."
+    assert handler.calls == 1
+
+
+def test_cache_matches_whitespace_normalized_text():
+    handler = _stream(b'{"response": "Hello there.", "done": true}')
+    cleanup = _cleanup(handler, bypass_max_chars=0)
+
+    cleanup.cleanup("hello there")
+    assert cleanup.cleanup("  hello \n  there ") == "Hello there."
+    assert handler.calls == 1
@@ -0,0 +1,31 @@
+import os
+
+from localwhispr.config import load_config
+
+
+def test_load_config_rereads_an_edited_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("ollama:\n  cleanup_model: first\n")
+    assert load_config(path).ollama.cleanup_model == "first"
+
+    path.write_text("ollama:\n  cleanup_model: second\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_config(path).ollama.cleanup_model == "second"
+
+
+def test_load_config_returns_independent_copies(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("ollama:\n  cleanup_model: first\n")
+
+    config = load_config(path)
+    config.ollama.cleanup_model = "mutated"
+
+    assert load_config(path).ollama.cleanup_model == "first"
+
+
+def test_punctuated_bypass_is_off_by_default():
+    from localwhispr.config import OllamaConfig
+
+    assert OllamaConfig().bypass_punctuated_max_chars == 0
@@ -0,0 +1,47 @@
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+
+from localwhispr.config import WhisperConfig
+from localwhispr.meeting_processor import transcribe_meeting_tracks
+
+
+class _FakeModel:
+    """Returns one segment per call, named after the chunk's first sample."""
+
+    def transcribe(self, audio, **kwargs):
+        segment = SimpleNamespace(start=float(audio[0] * 32768.0) / 1000, text=" said something ")
+        return [segment], None
+
+
+class _FakeTranscriber:
+    def _ensure_model(self):
+        return _FakeModel()
+
+
+def _write_wav(path, first_sample):
+    samples = np.full(16000, 5000, dtype=np.int16)
+    samples[0] = first_sample
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(samples.tobytes())
+    return path
+
+
+def test_tracks_are_labelled_and_interleaved(tmp_path):
+    mic = _write_wav(tmp_path / "mic.wav", 3000)  # segment at 3s
+    system = _write_wav(tmp_path / "system.wav", 1000)  # segment at 1s
+    config = WhisperConfig(batch_size=0)
+    text = transcribe_meeting_tracks(
+        [(mic, "Me"), (system, "Others")], config, _FakeTranscriber(),
+    )
+    assert text == "[00:01] Others: said something\n\n[00:03] Me: said something"
+
+
+def test_unlabelled_track_keeps_plain_lines(tmp_path):
+    wav = _write_wav(tmp_path / "combined.wav", 2000)
+    text = transcribe_meeting_tracks([(wav, "")], WhisperConfig(batch_size=0), _FakeTranscriber())
+    assert text == "[00:02] said something"
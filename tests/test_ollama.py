@@ -0,0 +1,28 @@
+import pytest
+
+from localwhispr.ollama import keep_alive_seconds
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("30m", 1800.0),
+        ("1h30m", 5400.0),
+        ("45s", 45.0),
+        ("500ms", 0.5),
+        ("300", 300.0),
+        (300, 300.0),
+        ("0", 0.0),
+    ],
+)
+def test_keep_alive_seconds(value, expected):
+    assert keep_alive_seconds(value) == expected
+
+
+@pytest.mark.parametrize("value", ["-1", "-1m", -1])
+def test_keep_alive_negative_means_forever(value):
+    assert keep_alive_seconds(value) is None
+
+
+def test_keep_alive_unparseable_counts_as_expired():
+    assert keep_alive_seconds("soon") == 0.0
@@ -0,0 +1,29 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sounddevice")
+
+from localwhispr.recorder import AudioRecorder, _wav_bytes  # noqa: E402
+
+
+def test_wav_bytes_joins_blocks():
+    blocks = [np.arange(4, dtype=np.int16), np.arange(4, 10, dtype=np.int16)]
+    with wave.open(io.BytesIO(bytes(_wav_bytes(blocks, 16000, 1)))) as wf:
+        assert (wf.getnchannels(), wf.getframerate(), wf.getsampwidth()) == (1, 16000, 2)
+        assert np.array_equal(np.frombuffer(wf.readframes(10), dtype=np.int16), np.arange(10))
+
+
+def test_recorder_builds_wav_from_callback_blocks_and_resets():
+    recorder = AudioRecorder()
+    recorder._recording = True
+    block = np.ones((1024, recorder.channels), dtype=np.int16)
+    recorder._audio_callback(block, 1024, None, None)
+    recorder._audio_callback(block, 1024, None, None)
+    recorder._recording = False
+
+    with wave.open(io.BytesIO(bytes(recorder._build_wav()))) as wf:
+        assert wf.getnframes() == 2048
+    assert recorder._frames == []
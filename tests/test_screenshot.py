@@ -0,0 +1,155 @@
+import json
+import os
+
+import httpx
+import pytest
+
+from localwhispr import screenshot
+from localwhispr.config import OllamaConfig
+
+
+@pytest.fixture
+def command(monkeypatch):
+    """A ScreenshotCommand talking to a fake Ollama; requests land in .requests."""
+    monkeypatch.setattr(screenshot, "warmup", lambda *args: command.warmups.append(args))
+    command = screenshot.ScreenshotCommand(OllamaConfig(warmup=False))
+    command.requests = []
+    command.warmups = []
+
+    def handler(request):
+        command.requests.append(json.loads(request.content))
+        return httpx.Response(200, content=b'{"response": " Hi"}\n{"response": " there", "done": true}\n')
+
+    command._client = httpx.Client(base_url="http://ollama", transport=httpx.MockTransport(handler))
+    return command
+
+
+def test_execute_sends_the_image_as_base64(command, monkeypatch):
+    monkeypatch.setattr(screenshot, "_capture_screenshot", lambda: b"\x89PNG fake image")
+
+    command.execute("describe this")
+
+    (body,) = command.requests
+    assert body["images"] == [screenshot.b64encode(b"\x89PNG fake image").decode()]
+
+
+def test_execute_builds_the_request_from_the_envelope(command, monkeypatch):
+    monkeypatch.setattr(screenshot, "_capture_screenshot", lambda: b"\x89PNG fake image")
+
+    command.execute('say "hello"')
+
+    (body,) = command.requests
+    assert body["model"] == command._model
+    assert body["keep_alive"] == command._keep_alive
+    assert body["stream"] is True
+    assert body["options"] == {"temperature": 0.3, "num_predict": 4096}
+    assert '"say "hello""' in body["prompt"]
+
+
+def test_execute_joins_the_streamed_response(command, monkeypatch):
+    monkeypatch.setattr(screenshot, "_capture_screenshot", lambda: b"\x89PNG fake image")
+    assert command.execute("describe this") == "Hi there"
+
+
+def test_execute_without_screenshot_streams_text_only(command, monkeypatch):
+    monkeypatch.setattr(screenshot, "_capture_screenshot", lambda: None)
+
+    assert command.execute("what time is it") == "Hi there"
+    assert command.requests[0]["stream"] is True
+    assert "images" not in command.requests[0]
+
+
+def test_execute_respects_disabled_warmup(command, monkeypatch):
+    monkeypatch.setattr(screenshot, "_capture_screenshot", lambda: None)
+    command.execute("hello")
+    assert command.warmups == []
+
+
+def test_execute_warms_up_only_after_keep_alive_lapsed(command, monkeypatch):
+    monkeypatch.setattr(screenshot, "_capture_screenshot", lambda: None)
+    command._warmup = True
+
+    command.execute("hello")  # model never used yet: warm up
+    command.execute("hello")  # used just now: no warmup
+    assert len(command.warmups) == 1
+
+    command._last_request = float("-inf")  # keep_alive lapsed
+    command.execute("hello")
+    assert len(command.warmups) == 2
+
+
+def test_capture_remembers_the_working_method(monkeypatch):
+    calls = []
+    monkeypatch.setattr(screenshot, "_capture_method", None)
+    monkeypatch.setattr(screenshot, "_which", lambda cmd: f"/usr/bin/{cmd}")
+    monkeypatch.setattr(screenshot, "_screenshot_via_printscreen", lambda: calls.append("printscreen"))
+    monkeypatch.setattr(
+        screenshot, "_screenshot_via_tool",
+        lambda cmd: calls.append(cmd[0]) or (b"png" if cmd[0] == "grim" else None),
+    )
+
+    assert screenshot._capture_screenshot() == b"png"
+    assert calls == ["printscreen", "gnome-screenshot", "grim"]
+
+    calls.clear()
+    assert screenshot._capture_screenshot() == b"png"
+    assert calls == ["grim"]
+
+
+class _FakeWatcher:
+    """Stands in for ``wl-paste --watch``: notify() reports a clipboard change."""
+
+    def __init__(self):
+        read_fd, self._write_fd = os.pipe()
+        self.stdout = os.fdopen(read_fd, "rb")
+
+    def notify(self):
+        os.write(self._write_fd, b"\n")
+
+    def terminate(self):
+        os.close(self._write_fd)
+
+    def wait(self, timeout=None):
+        return 0
+
+
+@pytest.fixture
+def clipboard(monkeypatch):
+    """Fake clipboard for the PrintScreen path; .reads counts full PNG reads."""
+    clipboard = type("Clipboard", (), {"png": b"old image", "reads": 0, "on_printscreen": None})()
+    watcher = _FakeWatcher()
+    watcher.notify()  # the selection already present at startup
+
+    def read_png():
+        clipboard.reads += 1
+        return clipboard.png
+
+    def press(*keys):
+        if clipboard.on_printscreen:
+            clipboard.on_printscreen()
+        return True
+
+    monkeypatch.setattr(screenshot, "_watch_clipboard", lambda: watcher)
+    monkeypatch.setattr(screenshot, "_clipboard_has_content", lambda: True)
+    monkeypatch.setattr(screenshot, "_read_clipboard_png", read_png)
+    monkeypatch.setattr(screenshot.ydotool, "key", press)
+    clipboard.watcher = watcher
+    return clipboard
+
+
+def test_printscreen_reads_the_new_image_once(clipboard):
+    def gnome_copies_capture():
+        clipboard.png = b"new image"
+        clipboard.watcher.notify()
+
+    clipboard.on_printscreen = gnome_copies_capture
+
+    assert screenshot._screenshot_via_printscreen() == b"new image"
+    assert clipboard.reads == 1
+
+
+def test_printscreen_without_clipboard_change_times_out(clipboard, monkeypatch):
+    monkeypatch.setattr(screenshot, "PRINTSCREEN_TIMEOUT_S", 0.05)
+
+    assert screenshot._screenshot_via_printscreen() is None
+    assert clipboard.reads == 0
@@ -0,0 +1,16 @@
+from localwhispr.server import _merge_segments
+
+
+def test_merge_segments_interleaves_by_start_time():
+    mic = [(0.0, 1.0, "hello"), (2.0, 3.0, "how are you")]
+    monitor = [(1.0, 2.0, "hi"), (3.5, 4.0, "fine")]
+    assert _merge_segments(mic, monitor) == "hello hi how are you fine"
+
+
+def test_merge_segments_keeps_mic_first_on_ties():
+    assert _merge_segments([(1.0, 2.0, "mic")], [(1.0, 2.0, "monitor")]) == "mic monitor"
+
+
+def test_merge_segments_single_track():
+    assert _merge_segments([], [(0.0, 1.0, "only")]) == "only"
+    assert _merge_segments([], []) == ""
@@ -0,0 +1,38 @@
+import socket
+
+import pytest
+
+from localwhispr import ydotool
+
+
+@pytest.fixture
+def ydotoold(tmp_path, monkeypatch):
+    """A datagram socket standing in for ydotoold."""
+    path = tmp_path / "ydotool_socket"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    server.bind(str(path))
+    server.settimeout(1)
+    monkeypatch.setenv("YDOTOOL_SOCKET", str(path))
+    monkeypatch.setattr(ydotool, "_sock", None)
+    yield server
+    server.close()
+    if ydotool._sock is not None:
+        ydotool._sock.close()
+        ydotool._sock = None
+
+
+def test_key_sends_key_and_syn_events(ydotoold):
+    assert ydotool.key("29:1", "47:1", "47:0", "29:0", delay_s=0)
+
+    events = [ydotool._INPUT_EVENT.unpack(ydotoold.recv(64)) for _ in range(8)]
+    key_events = [(ev_type, code, value) for _, _, ev_type, code, value in events[0::2]]
+    syn_events = [(ev_type, code, value) for _, _, ev_type, code, value in events[1::2]]
+
+    assert key_events == [(1, 29, 1), (1, 47, 1), (1, 47, 0), (1, 29, 0)]
+    assert syn_events == [(0, 0, 0)] * 4
+
+
+def test_key_without_daemon_returns_false(tmp_path, monkeypatch):
+    monkeypatch.setenv("YDOTOOL_SOCKET", str(tmp_path / "missing"))
+    monkeypatch.setattr(ydotool, "_sock", None)
+    assert ydotool.key("29:1", delay_s=0) is False